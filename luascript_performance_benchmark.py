@@ -8,13 +8,23 @@ to validate LUASCRIPT's claim of >5x faster mathematical programming.
 """
 
 import argparse
+import contextlib
+import functools
+import io
+import hashlib
+import importlib.util
 import json
 import os
+import re
 import shutil
+import statistics
+import string
 import subprocess
 import sys
-import tempfile
+import threading
 import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -23,267 +33,199 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     psutil = None
 
-class LuaScriptBenchmark:
-    def __init__(self, lua_bin: Optional[str] = None, quick: bool = False, output_path: Optional[str] = None):
-        self.results = {}
-        self.quick = quick
-        self.repo_root = Path(__file__).resolve().parent
-        self.compiler_path = self.repo_root / "src" / "luascript_compiler.py"
-        self.lua_bin = lua_bin or os.environ.get("LUA_BIN", "lua")
-        self.commit_hash = self._get_commit_hash()
-        self.output_path = Path(output_path) if output_path else None
-        
-    def _get_commit_hash(self) -> str:
-        try:
-            return (
-                subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=self.repo_root)
-                .decode()
-                .strip()
-            )
-        except Exception:
-            return "unknown"
-        
-    def capture_memory_mb(self) -> Optional[float]:
-        if psutil is None:
-            return None
-        try:
-            process = psutil.Process(os.getpid())
-            return process.memory_info().rss / (1024 * 1024)
-        except Exception:
-            return None
-        
-    def log_result(self, test_name: str, language: str, time_ms: float, memory_mb: Optional[float] = None, code_size_bytes: Optional[int] = None, compile_time_ms: Optional[float] = None):
-        """Log benchmark results"""
-        if test_name not in self.results:
-            self.results[test_name] = {}
-        self.results[test_name][language] = {
-            'time_ms': time_ms,
-            'compile_time_ms': compile_time_ms,
-            'memory_mb': memory_mb if memory_mb is not None else self.capture_memory_mb(),
-            'code_size_bytes': code_size_bytes,
-            'timestamp': time.time(),
-            'commit': self.commit_hash
-        }
-        
-    def resolved_output_path(self) -> Path:
-        if self.output_path:
-            self.output_path.parent.mkdir(parents=True, exist_ok=True)
-            return self.output_path
-        default_dir = self.repo_root / "artifacts" / "performance"
-        default_dir.mkdir(parents=True, exist_ok=True)
-        return default_dir / f"benchmark_{self.commit_hash}.json"
-        
-    def run_fibonacci_benchmark(self, n: int = 35) -> Dict[str, float]:
-        """Benchmark recursive Fibonacci calculation"""
-        print(f"?? Running Fibonacci({n}) benchmark...")
-
-        # JavaScript (Node.js) version
-        js_code = f"""
-        function fibonacci(n) {{
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Benchmark programs. Parameterised sources are string.Template instances
+# ($n / $size); the constant LUASCRIPT programs double as stable cache keys.
+# Fibonacci implementations per mode: 'naive' is the O(phi^n) recursion that
+# measures call overhead, 'memo' and 'iterative' are the O(n) variants that
+# keep large n tractable. Substituted into the templates as $fib_body.
+_FIB_MODES = ('naive', 'memo', 'iterative')
+
+_JS_FIB_BODIES = {
+    'naive': """
+        function fibonacci(n) {
             if (n <= 1) return n;
             return fibonacci(n - 1) + fibonacci(n - 2);
-        }}
+        }""",
+    'memo': """
+        const memo = [0, 1];
+        function fibonacci(n) {
+            if (memo[n] === undefined) memo[n] = fibonacci(n - 1) + fibonacci(n - 2);
+            return memo[n];
+        }""",
+    'iterative': """
+        function fibonacci(n) {
+            let a = 0, b = 1;
+            for (let i = 0; i < n; i++) [a, b] = [b, a + b];
+            return a;
+        }""",
+}
+
+_PY_FIB_BODIES = {
+    'naive': """
+def fibonacci(n):
+    if n <= 1:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)""",
+    'memo': """
+memo = {0: 0, 1: 1}
 
-        console.time('fibonacci');
-        const result = fibonacci({n});
-        console.timeEnd('fibonacci');
+def fibonacci(n):
+    if n not in memo:
+        memo[n] = fibonacci(n - 1) + fibonacci(n - 2)
+    return memo[n]""",
+    'iterative': """
+def fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a""",
+}
+
+# LUASCRIPT uses a plain object for the memo (array literals go through the
+# runtime's _LS.array wrapper) and a while loop (i++ as a for-update does not
+# transpile to a valid Lua statement yet).
+_LS_FIB_BODIES = {
+    'naive': """
+function fibonacci(n) {
+    if (n <= 1) return n;
+    return fibonacci(n - 1) + fibonacci(n - 2);
+}""",
+    'memo': """
+let memo = {};
+function fibonacci(n) {
+    if (n <= 1) return n;
+    if (memo[n] == null) {
+        memo[n] = fibonacci(n - 1) + fibonacci(n - 2);
+    }
+    return memo[n];
+}""",
+    'iterative': """
+function fibonacci(n) {
+    let a = 0;
+    let b = 1;
+    let i = 0;
+    while (i < n) {
+        let t = a + b;
+        a = b;
+        b = t;
+        i = i + 1;
+    }
+    return a;
+}""",
+}
+
+_JS_FIB_TEMPLATE = string.Template("""$fib_body
+
+        const t0 = performance.now();
+        const result = fibonacci($n);
+        console.log(`Time: $${(performance.now() - t0).toFixed(3)}ms`);
         console.log('Result:', result);
-        """
-
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-                f.write(js_code)
-                js_file = f.name
+        """)
 
-            start_time = time.time()
-            result = subprocess.run(['node', js_file], capture_output=True, text=True, timeout=30)
-            js_time = (time.time() - start_time) * 1000
-
-            if result.returncode == 0:
-                self.log_result('fibonacci', 'JavaScript', js_time, self.capture_memory_mb())
-                print(f"  ? JavaScript: {js_time:.1f}ms")
-            else:
-                print(f"  ? JavaScript failed: {result.stderr}")
-
-            os.unlink(js_file)
-        except Exception as e:
-            print(f"  ?? JavaScript benchmark failed: {e}")
-
-        # Python version
-        python_code = f"""
+# Same bodies JIT-compiled with Numba (not 'memo': it relies on a global dict).
+# The first call compiles, so it happens before the timed region, as the JIT
+# warm-up does for node.
+_PY_NUMBA_FIB_TEMPLATE = string.Template("""
 import time
+from numba import njit
+$fib_body
 
-def fibonacci(n):
-    if n <= 1:
-        return n
-    return fibonacci(n - 1) + fibonacci(n - 2)
+fibonacci = njit(fibonacci)
+fibonacci(2)
 
-start = time.time()
-result = fibonacci({n})
-end = time.time()
-print(f"Time: {(end - start) * 1000:.1f}ms")
+start = time.perf_counter_ns()
+result = fibonacci($n)
+end = time.perf_counter_ns()
+print(f"Time: {(end - start) / 1e6:.1f}ms")
 print(f"Result: {result}")
-"""
-
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(python_code)
-                py_file = f.name
-
-            start_time = time.time()
-            result = subprocess.run([sys.executable, py_file], capture_output=True, text=True, timeout=30)
-            py_time = (time.time() - start_time) * 1000
+""")
 
-            if result.returncode == 0:
-                self.log_result('fibonacci', 'Python', py_time, self.capture_memory_mb())
-                print(f"  ? Python: {py_time:.1f}ms")
-            else:
-                print(f"  ? Python failed: {result.stderr}")
+_PY_FIB_TEMPLATE = string.Template("""
+import time
+$fib_body
 
-            os.unlink(py_file)
-        except Exception as e:
-            print(f"  ?? Python benchmark failed: {e}")
+start = time.perf_counter_ns()
+result = fibonacci($n)
+end = time.perf_counter_ns()
+print(f"Time: {(end - start) / 1e6:.1f}ms")
+print(f"Result: {result}")
+""")
 
-        # LUASCRIPT version
-        luascript_code = f"""
-function fibonacci(n) {{
-    if (n <= 1) return n;
-    return fibonacci(n - 1) + fibonacci(n - 2);
-}}
+# Date is not available in the Lua runtime; Lua's os.clock() is, so the
+# LUASCRIPT programs time their workload with it (CPU seconds, hence * 1000).
+_LS_FIB_TEMPLATE = string.Template("""$fib_body
 
-let start = Date.now();
-let result = fibonacci({n});
-let end = Date.now();
-print("Time:", (end - start), "ms");
+let t0 = os.clock();
+let result = fibonacci($n);
+print("Time:", (os.clock() - t0) * 1000, "ms");
 print("Result:", result);
-"""
+""")
 
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.ls', delete=False) as f:
-                f.write(luascript_code)
-                ls_file = f.name
-
-            compile_start = time.time()
-            compile_result = subprocess.run([
-                sys.executable, str(self.compiler_path), 'compile', ls_file
-            ], capture_output=True, text=True)
-            compile_time = (time.time() - compile_start) * 1000
-
-            if compile_result.returncode == 0:
-                lua_file = ls_file.replace('.ls', '.lua')
-
-                start_time = time.time()
-                run_result = subprocess.run([self.lua_bin, lua_file], capture_output=True, text=True, timeout=30)
-                luascript_time = (time.time() - start_time) * 1000
-                code_size = os.path.getsize(lua_file) if os.path.exists(lua_file) else None
-
-                if run_result.returncode == 0:
-                    self.log_result('fibonacci', 'LUASCRIPT', luascript_time, self.capture_memory_mb(), code_size, compile_time)
-                    print(f"  ?? LUASCRIPT: {luascript_time:.1f}ms (compile {compile_time:.1f}ms)")
-                else:
-                    print(f"  ? LUASCRIPT execution failed: {run_result.stderr}")
-
-                os.unlink(lua_file)
-            else:
-                print(f"  ? LUASCRIPT compilation failed: {compile_result.stderr}")
+_JS_ARRAY_OPS_TEMPLATE = string.Template("""
+        const numbers = Array.from({length: $size}, (_, i) => i + 1);
 
-            os.unlink(ls_file)
-        except Exception as e:
-            print(f"  ?? LUASCRIPT benchmark failed: {e}")
-
-        return self.results.get('fibonacci', {})
-
-    def run_array_operations_benchmark(self, size: int = 10000) -> Dict[str, float]:
-        """Benchmark array map and reduce operations"""
-        size = min(size, 1000) if self.quick else size
-        print(f"?? Running Array Operations benchmark (size: {size})...")
-
-        # JavaScript version
-        js_code = f"""
-        const numbers = Array.from({{length: {size}}}, (_, i) => i + 1);
-
-        console.time('array-ops');
+        const t0 = performance.now();
         const doubled = numbers.map(x => x * 2);
         const sum = doubled.reduce((a, b) => a + b, 0);
-        console.timeEnd('array-ops');
+        console.log(`Time: $${(performance.now() - t0).toFixed(3)}ms`);
         console.log('Sum:', sum);
-        """
+        """)
 
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-                f.write(js_code)
-                js_file = f.name
-
-            start_time = time.time()
-            result = subprocess.run(['node', js_file], capture_output=True, text=True, timeout=30)
-            js_time = (time.time() - start_time) * 1000
-
-            if result.returncode == 0:
-                self.log_result('array_ops', 'JavaScript', js_time, self.capture_memory_mb())
-                print(f"  ? JavaScript: {js_time:.1f}ms")
-            else:
-                print(f"  ? JavaScript failed: {result.stderr}")
-
-            os.unlink(js_file)
-        except Exception as e:
-            print(f"  ?? JavaScript benchmark failed: {e}")
-
-        # LUASCRIPT version
-        luascript_code = f"""
+_LS_ARRAY_OPS_TEMPLATE = string.Template("""
         let numbers = [];
-        for (let i = 1; i <= {size}; i++) {{
+        let i = 1;
+        while (i <= $size) {
             numbers.push(i);
-        }}
+            i = i + 1;
+        }
 
-        let start = Date.now();
+        let t0 = os.clock();
         let doubled = numbers.map(x => x * 2);
         let sum = doubled.reduce((a, b) => a + b, 0);
-        let end = Date.now();
-        print("Time:", (end - start), "ms");
+        print("Time:", (os.clock() - t0) * 1000, "ms");
         print("Sum:", sum);
-        """
-
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.ls', delete=False) as f:
-                f.write(luascript_code)
-                ls_file = f.name
-
-            compile_start = time.time()
-            compile_result = subprocess.run([
-                sys.executable, str(self.compiler_path), 'compile', ls_file
-            ], capture_output=True, text=True)
-            compile_time = (time.time() - compile_start) * 1000
-
-            if compile_result.returncode == 0:
-                lua_file = ls_file.replace('.ls', '.lua')
-
-                start_time = time.time()
-                run_result = subprocess.run([self.lua_bin, lua_file], capture_output=True, text=True, timeout=30)
-                luascript_time = (time.time() - start_time) * 1000
-                code_size = os.path.getsize(lua_file) if os.path.exists(lua_file) else None
-
-                if run_result.returncode == 0:
-                    self.log_result('array_ops', 'LUASCRIPT', luascript_time, self.capture_memory_mb(), code_size, compile_time)
-                    print(f"  ?? LUASCRIPT: {luascript_time:.1f}ms (compile {compile_time:.1f}ms)")
-                else:
-                    print(f"  ? LUASCRIPT execution failed: {run_result.stderr}")
-
-                os.unlink(lua_file)
-            else:
-                print(f"  ? LUASCRIPT compilation failed: {compile_result.stderr}")
-
-            os.unlink(ls_file)
-        except Exception as e:
-            print(f"  ?? LUASCRIPT benchmark failed: {e}")
+        """)
+
+# Tight numeric loop: what the "mathematical programming" speedup is measured on
+_JS_ITER_MATH_TEMPLATE = string.Template("""
+        const t0 = performance.now();
+        let total = 0;
+        for (let i = 0; i < $n; i++) {
+            total += Math.sin(i) * Math.cos(i);
+        }
+        console.log(`Time: $${(performance.now() - t0).toFixed(3)}ms`);
+        console.log('Total:', total);
+        """)
 
-        return self.results.get('array_ops', {})
+_PY_ITER_MATH_TEMPLATE = string.Template("""
+import math
+import time
 
-    def run_compilation_speed_benchmark(self) -> Dict[str, float]:
-        """Benchmark compilation speed"""
-        print("⚡ Running Compilation Speed benchmark...")
-        
-        # Create a moderately complex LUASCRIPT file
-        complex_code = """
+start = time.perf_counter_ns()
+total = sum(math.sin(i) * math.cos(i) for i in range($n))
+end = time.perf_counter_ns()
+print(f"Time: {(end - start) / 1e6:.1f}ms")
+print(f"Total: {total}")
+""")
+
+_LS_ITER_MATH_TEMPLATE = string.Template("""
+let t0 = os.clock();
+let total = 0;
+let i = 0;
+while (i < $n) {
+    total = total + Math.sin(i) * Math.cos(i);
+    i = i + 1;
+}
+print("Time:", (os.clock() - t0) * 1000, "ms");
+print("Total:", total);
+""")
+
+_LS_COMPILATION_BENCHMARK = """
         // Complex LUASCRIPT program for compilation benchmarking
         class MathUtils {
             constructor() {
@@ -306,15 +248,12 @@ print("Result:", result);
             }
             
             gaussianPdf(x, mu = 0, sigma = 1) {
-                return (1 / √(2 × this.pi × sigma²)) × ℯ^(-(x - mu)² / (2 × sigma²));
+                return (1 / √(2 × this.pi × sigma²)) × Math.exp(-(x - mu)² / (2 × sigma²));
             }
         }
         
         function processArray(data) {
-            return data
-                .map(x => x * 2)
-                .filter(x => x > 10)
-                .reduce((sum, x) => sum + x, 0);
+            return data.map(x => x * 2).filter(x => x > 10).reduce((sum, x) => sum + x, 0);
         }
         
         let mathUtils = new MathUtils();
@@ -357,181 +296,823 @@ print("Result:", result);
             }
         }
         
+        // Fixed-seed LCG instead of Math.random() so the program (and its
+        // run time) is identical on every run
+        let seed = 12345;
+        function rnd() {
+            seed = (seed * 1103515245 + 12345) % 2147483648;
+            return (seed / 2147483648) * 10;
+        }
+        
         let vectors = [];
         for (let i = 0; i < 100; i++) {
-            vectors.push(new Vector2D(Math.random() * 10, Math.random() * 10));
+            vectors.push(new Vector2D(rnd(), rnd()));
         }
         
-        let totalMagnitude = vectors
-            .map(v => v.magnitude())
-            .reduce((sum, mag) => sum + mag, 0);
-            
+        let totalMagnitude = vectors.map(v => v.magnitude()).reduce((sum, mag) => sum + mag, 0);
+
         print("Total magnitude:", totalMagnitude);
         """
-        
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.ls', delete=False) as f:
-                f.write(complex_code)
-                ls_file = f.name
-                
-            # Measure compilation time
-            start_time = time.time()
-            compile_result = subprocess.run([
-                sys.executable, str(self.compiler_path), 'compile', ls_file
-            ], capture_output=True, text=True)
-            compile_time = (time.time() - start_time) * 1000
-            
-            if compile_result.returncode == 0:
-                lua_file = ls_file.replace('.ls', '.lua')
-                code_size = os.path.getsize(lua_file) if os.path.exists(lua_file) else None
-
-                start_time = time.time()
-                run_result = subprocess.run([self.lua_bin, lua_file], capture_output=True, text=True, timeout=10)
-                self.log_result('compilation', 'LUASCRIPT', compile_time, self.capture_memory_mb(), code_size, compile_time)
-                print(f"  ?? LUASCRIPT compilation: {compile_time:.1f}ms")
-
-                if run_result.returncode == 0:
-                    print("  ✅ Generated code executes successfully")
-                else:
-                    print(f"  ⚠️ Generated code execution warning: {run_result.stderr}")
-                
-                os.unlink(lua_file)
-            else:
-                print(f"  ❌ LUASCRIPT compilation failed: {compile_result.stderr}")
-                
-            os.unlink(ls_file)
-        except Exception as e:
-            print(f"  ⚠️ Compilation benchmark failed: {e}")
-            
-        return self.results.get('compilation', {})
-        
-    def run_mathematical_expression_benchmark(self) -> Dict[str, float]:
-        """Benchmark mathematical expression evaluation"""
-        print("🔬 Running Mathematical Expression benchmark...")
-        
-        # LUASCRIPT version with beautiful mathematical syntax
-        luascript_code = """
+
+_LS_MATH_BENCHMARK = """
         let results = [];
-        let start = Date.now();
+        let t0 = os.clock();
+        let i = 1;
         
-        for (let i = 1; i <= 1000; i++) {
+        while (i <= 1000) {
             let x = i / 100.0;
             
             // Beautiful mathematical expressions
             let area = π × x²;
-            let gaussian = (1/√(2×π)) × ℯ^(-x²/2);
+            let gaussian = (1/√(2×π)) × Math.exp(-x²/2);
             let distance = √((x - 1)² + (x - 2)²);
             let polynomial = x³ - 2×x² + 3×x - 1;
             
             results.push(area + gaussian + distance + polynomial);
+            i = i + 1;
         }
         
-        let end = Date.now();
-        print("Time:", (end - start), "ms");
+        print("Time:", (os.clock() - t0) * 1000, "ms");
         print("Results calculated:", results.length);
         print("Sample result:", results[0]);
         """
+
+_REPORT_HEADER = """
+{rule}
+?? LUASCRIPT PERFORMANCE BENCHMARK REPORT
+Commit: {commit}
+{rule}
+
+"""
+
+_REPORT_FOOTER = """
+?? CONCLUSION: LUASCRIPT performance tracked with per-commit metadata
+   while maintaining mathematical programming elegance!
+
+"""
+
+# What each benchmark's numbers stand for; recursive Fibonacci is dominated by
+# call overhead, so it must not back the math-performance claim.
+_BENCHMARK_METRICS = {
+    'fibonacci': 'call_overhead',
+    'iterative_math': 'math_perf',
+}
+
+_RESULT_RE = re.compile(r'Result:\s*(\d+)')
+# In-process timing printed by the benchmark programs themselves ("Time: 12.3ms")
+_TIME_RE = re.compile(r'^\s*Time:\s*([\d.]+(?:e[-+]?\d+)?)\s*ms', re.I | re.M)
+
+# Snippets are streamed to long-lived interpreters line by line; a line equal to
+# _END_MARKER closes a snippet and the worker answers with "__DONE__ <status>".
+_END_MARKER = "--END--"
+_DONE_MARKER = "__DONE__"
+
+_LUA_WORKER = r"""
+local load_chunk = loadstring or load
+local buf = {}
+for line in io.lines() do
+    if line == "--END--" then
+        local status = 0
+        local chunk, err = load_chunk(table.concat(buf, "\n"), "=snippet")
+        if not chunk then
+            print(err)
+            status = 1
+        else
+            local ok, msg = pcall(chunk)
+            if not ok then
+                print(msg)
+                status = 1
+            end
+        end
+        buf = {}
+        print("__DONE__ " .. status)
+        io.stdout:flush()
+    else
+        buf[#buf + 1] = line
+    end
+end
+"""
+
+_NODE_WORKER = r"""
+const readline = require('readline');
+const vm = require('vm');
+// Snippets run in this (main) context: a fresh vm context per sample would
+// route every global lookup through the sandbox interceptor and throw away the
+// JIT state the warm-up sample built. The IIFE keeps top-level let/const from
+// colliding across samples; each distinct snippet is compiled once.
+const scripts = new Map();
+let buf = [];
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    if (line !== '--END--') { buf.push(line); return; }
+    let status = 0;
+    try {
+        const code = buf.join('\n');
+        let script = scripts.get(code);
+        if (script === undefined) {
+            script = new vm.Script('(function(){' + code + '\n})()', { filename: 'snippet.js' });
+            scripts.set(code, script);
+        }
+        script.runInThisContext();
+    } catch (e) {
+        console.log(String((e && e.stack) || e));
+        status = 1;
+    }
+    buf = [];
+    console.log('__DONE__ ' + status);
+});
+"""
+
+_PYTHON_WORKER = r"""
+import sys, traceback
+buf = []
+for line in iter(sys.stdin.readline, ""):
+    if line.rstrip("\n") != "--END--":
+        buf.append(line)
+        continue
+    status = 0
+    try:
+        exec(compile("".join(buf), "<snippet>", "exec"), {"__name__": "__snippet__"})
+    except Exception:
+        traceback.print_exc(file=sys.stdout)
+        status = 1
+    buf = []
+    print("__DONE__", status, flush=True)
+"""
+
+
+class _Runner:
+    """Long-lived interpreter that executes code snippets fed over stdin.
+
+    The process is spawned lazily on the first snippet so interpreters that are
+    never used (or not installed) cost nothing; afterwards every snippet reuses
+    the warm process, keeping interpreter start-up out of the measurements.
+    """
+
+    def __init__(self, argv: List[str], cwd: Optional[Path] = None, env: Optional[Dict[str, str]] = None):
+        self.argv = argv
+        self.cwd = cwd
+        self.env = env
+        self.proc: Optional[subprocess.Popen] = None
+
+    def start(self) -> None:
+        """Spawn the worker and wait until it has finished initialising."""
+        if self.proc is not None and self.proc.poll() is None:
+            return
+        self.proc = subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=self.cwd,
+            env=self.env,
+            close_fds=False,
+            text=True,
+            bufsize=1,
+        )
+        self._exchange("", timeout=30)
+
+    def run_snippet(self, code: str, timeout: float = 30) -> Tuple[bool, str]:
+        """Run ``code`` in the worker and return ``(ok, captured_stdout)``."""
+        self.start()
+        return self._exchange(code, timeout)
+
+    def _exchange(self, code: str, timeout: float) -> Tuple[bool, str]:
+        proc = self.proc
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.start()
+        try:
+            proc.stdin.write(f"{code}\n{_END_MARKER}\n")
+            proc.stdin.flush()
+            output = []
+            for line in iter(proc.stdout.readline, ""):
+                if line.startswith(_DONE_MARKER):
+                    return line.split()[-1] == "0", "".join(output)
+                output.append(line)
+        finally:
+            watchdog.cancel()
+        self.close()
+        raise RuntimeError(f"{self.argv[0]} worker exited unexpectedly: {''.join(output).strip()}")
+
+    def rss_mb(self) -> Optional[float]:
+        """Resident set size of the worker process in MB (None if unavailable)"""
+        if self.proc is None:
+            return None
+        try:
+            with open(f"/proc/{self.proc.pid}/status", encoding="ascii") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1]) / 1024
+        except (OSError, ValueError):
+            pass
+        if psutil is None:
+            return None
+        try:
+            return psutil.Process(self.proc.pid).memory_info().rss / (1024 * 1024)
+        except Exception:
+            return None
+
+    def close(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+            proc.wait()
+
+
+class _InProcessPythonRunner:
+    """Runs Python snippets inside the benchmark process itself.
+
+    Same interface as _Runner, for the Python baseline: there is no pipe round
+    trip per sample, and each distinct snippet is compiled only once.
+    """
+
+    def __init__(self):
+        self._compiled: Dict[str, object] = {}
+        self._proc = psutil.Process(os.getpid()) if psutil is not None else None
+
+    def start(self) -> None:
+        pass
+
+    def run_snippet(self, code: str, timeout: float = 30) -> Tuple[bool, str]:
+        """Execute ``code`` in a fresh namespace and return ``(ok, captured_stdout)``."""
+        compiled = self._compiled.get(code)
+        if compiled is None:
+            compiled = self._compiled[code] = compile(code, "<snippet>", "exec")
+        out = io.StringIO()
+        ok = True
+        with contextlib.redirect_stdout(out):
+            try:
+                exec(compiled, {"__name__": "__snippet__"})
+            except Exception:
+                traceback.print_exc(file=out)
+                ok = False
+        return ok, out.getvalue()
+
+    def rss_mb(self) -> Optional[float]:
+        if self._proc is None:
+            return None
+        try:
+            return self._proc.memory_info().rss / (1024 * 1024)
+        except Exception:
+            return None
+
+    def close(self) -> None:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _git_head(repo_root: Path) -> str:
+    """HEAD commit of ``repo_root``; memoised since every phase worker re-instantiates the benchmark"""
+    try:
+        return (
+            subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=repo_root, close_fds=False)
+            .decode()
+            .strip()
+        )
+    except Exception:
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=1)
+def _compiler_fingerprint(repo_root: Path) -> str:
+    """Fingerprint (path, mtime, size) of the compiler's Python sources.
+
+    Folded into the compile-cache key so that uncommitted edits to the
+    lexer/parser/transpiler invalidate artifacts cached under the same HEAD.
+    """
+    src = repo_root / "src"
+    files = [src / "luascript_compiler.py"]
+    for package in ("lexer", "parser", "transpiler"):
+        files.extend(sorted((src / package).glob("*.py")))
+    digest = hashlib.sha256()
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.relative_to(repo_root)}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class _CompileError(RuntimeError):
+    """Raised when the LUASCRIPT compiler rejects a benchmark program."""
+
+
+class _CompilerServer:
+    """Client for ``luascript_compiler.py serve``, a long-running compile worker.
+
+    Requests and replies are size-prefixed (``<n>`` / ``OK <n>`` / ``ERR <n>``)
+    binary frames, so the compiler's interpreter start-up and imports are paid
+    once per benchmark run rather than once per compile.
+    """
+
+    def __init__(self, compiler_path: Path):
+        self.argv = [sys.executable, str(compiler_path), 'serve']
+        self.proc: Optional[subprocess.Popen] = None
+
+    def start(self) -> None:
+        if self.proc is not None and self.proc.poll() is None:
+            return
+        self.proc = subprocess.Popen(self.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     close_fds=False)
+        # Warm-up request: finishes imports before anything is timed
+        self.compile("")
+
+    def compile(self, ls_source: str, timeout: float = 60) -> bytes:
+        """Compile ``ls_source`` and return the Lua code (raises _CompileError)
+
+        Only a complete ``OK`` frame is returned: a reply cut short by the
+        worker dying is an error, never truncated Lua.
+        """
+        self.start()
+        proc = self.proc
+        request = ls_source.encode('utf-8')
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.start()
+        try:
+            proc.stdin.write(b"%d\n" % len(request) + request)
+            proc.stdin.flush()
+            header = proc.stdout.readline().split()
+            if len(header) != 2:
+                raise _CompileError("compiler worker exited unexpectedly")
+            size = int(header[1])
+            body = proc.stdout.read(size)
+        except (BrokenPipeError, ValueError) as e:
+            raise _CompileError(f"compiler worker failed: {e}") from e
+        finally:
+            watchdog.cancel()
+        if len(body) != size:
+            self.close()
+            raise _CompileError(f"compiler worker exited mid-reply ({len(body)} of {size} bytes)")
+        if header[0] != b'OK':
+            raise _CompileError(body.decode('utf-8', errors='replace'))
+        return body
+
+    def close(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+            proc.wait()
+
+
+class LuaScriptBenchmark:
+    def __init__(self, lua_bin: Optional[str] = None, quick: bool = False, output_path: Optional[str] = None,
+                 fib_mode: str = 'naive', in_process_python: bool = False):
+        self.results = {}
+        self.in_process_python = in_process_python
+        self.quick = quick
+        self.fib_mode = fib_mode
+        # Quick/CI mode takes a single cold sample; full runs discard one warm-up
+        # run (JIT tier-up, cold caches) and keep the best of five.
+        self.warmup = 0 if quick else 1
+        self.repeats = 1 if quick else 5
+        self.repo_root = Path(__file__).resolve().parent
+        self.compiler_path = self.repo_root / "src" / "luascript_compiler.py"
+        self.lua_bin = lua_bin or os.environ.get("LUA_BIN", "lua")
+        self.commit_hash = self._get_commit_hash()
+        self.output_path = Path(output_path) if output_path else None
+        self._output_path_resolved: Optional[Path] = None
+        self._psutil_proc = psutil.Process(os.getpid()) if psutil is not None else None
+        self.cache_dir = self.repo_root / "artifacts" / "cache"
+        self.compiler_server = _CompilerServer(self.compiler_path)
+        self.lua_runner = _Runner([self.lua_bin, "-e", _LUA_WORKER], cwd=self.repo_root)
+        self.node_runner = _Runner(["node", "-e", _NODE_WORKER])
+        # -S: the baseline programs only need the stdlib, so skip site-packages setup
+        self.python_runner = (
+            _InProcessPythonRunner() if in_process_python
+            else _Runner([sys.executable, "-u", "-S", "-c", _PYTHON_WORKER])
+        )
+        # Optional JIT baseline; needs site-packages, so it gets its own worker
+        self.numba_runner: Optional[_Runner] = None
+        if importlib.util.find_spec("numba") is not None:
+            numba_env = dict(os.environ, NUMBA_CACHE_DIR=str(self.cache_dir / "numba"))
+            self.numba_runner = _Runner([sys.executable, "-u", "-c", _PYTHON_WORKER], env=numba_env)
+
+    def __enter__(self) -> "LuaScriptBenchmark":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the persistent interpreter workers"""
+        for runner in (self.lua_runner, self.node_runner, self.python_runner, self.numba_runner):
+            if runner is not None:
+                runner.close()
+        self.compiler_server.close()
         
+    def _get_commit_hash(self) -> str:
+        return _git_head(self.repo_root)
+        
+    def capture_memory_mb(self) -> Optional[float]:
+        if self._psutil_proc is None:
+            return None
         try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.ls', delete=False) as f:
-                f.write(luascript_code)
-                ls_file = f.name
-                
-            # Compile and run
-            compile_start = time.time()
-            compile_result = subprocess.run([
-                sys.executable, str(self.compiler_path), 'compile', ls_file
-            ], capture_output=True, text=True)
-            compile_time = (time.time() - compile_start) * 1000
-            
-            if compile_result.returncode == 0:
-                lua_file = ls_file.replace('.ls', '.lua')
-                
-                start_time = time.time()
-                run_result = subprocess.run([self.lua_bin, lua_file], capture_output=True, text=True, timeout=30)
-                luascript_time = (time.time() - start_time) * 1000
-                code_size = os.path.getsize(lua_file) if os.path.exists(lua_file) else None
-                
-                if run_result.returncode == 0:
-                    self.log_result('math_expressions', 'LUASCRIPT', luascript_time, self.capture_memory_mb(), code_size, compile_time)
-                    print(f"  ?? LUASCRIPT: {luascript_time:.1f}ms (compile {compile_time:.1f}ms)")
-                else:
-                    print(f"  ? LUASCRIPT execution failed: {run_result.stderr}")
-                
-                os.unlink(lua_file)
+            return self._psutil_proc.memory_info().rss / (1024 * 1024)
+        except Exception:
+            return None
+        
+    def log_result(self, test_name: str, language: str, time_ms: float, memory_mb: Optional[float] = None, code_size_bytes: Optional[int] = None, compile_time_ms: Optional[float] = None, samples: Optional[List[float]] = None, workload: Optional[List[float]] = None):
+        """Log benchmark results (``samples`` adds min/median/stdev of repeated runs,
+        ``workload`` the self-reported in-process time)"""
+        if test_name not in self.results:
+            self.results[test_name] = {}
+        entry = {
+            'metric': _BENCHMARK_METRICS.get(test_name),
+            'time_ms': time_ms,
+            'workload_ms': min(workload) if workload else None,
+            'compile_time_ms': compile_time_ms,
+            'memory_mb': memory_mb,
+            'code_size_bytes': code_size_bytes,
+            'timestamp': time.time(),
+            'commit': self.commit_hash
+        }
+        if samples:
+            entry.update({
+                'time_ms_min': min(samples),
+                'time_ms_median': statistics.median(samples),
+                'time_ms_stdev': statistics.pstdev(samples),
+                'n': len(samples),
+            })
+        self.results[test_name][language] = entry
+
+    def _sample(self, runner: _Runner, code: str) -> Tuple[bool, str, List[float], List[float]]:
+        """Time ``code`` on a warm worker: ``self.warmup`` discarded runs, then ``self.repeats`` samples (ms)
+
+        Returns wall-clock samples alongside the workload time each run
+        reported itself, which excludes snippet setup and I/O; the second
+        list is empty when the program prints no timing.
+        """
+        runner.start()
+        samples: List[float] = []
+        workload: List[float] = []
+        for i in range(self.warmup + self.repeats):
+            start_ns = time.perf_counter_ns()
+            ok, output = runner.run_snippet(code)
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            if not ok:
+                return False, output, samples, workload
+            if i >= self.warmup:
+                samples.append(elapsed_ms)
+                reported = self._reported_time_ms(output)
+                if reported is not None:
+                    workload.append(reported)
+        if len(workload) != len(samples):
+            workload = []
+        return True, output, samples, workload
+
+    @staticmethod
+    def _reported_time_ms(output: str) -> Optional[float]:
+        match = _TIME_RE.search(output)
+        if not match:
+            return None
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return None
+
+    def resolved_output_path(self) -> Path:
+        if self._output_path_resolved is None:
+            path = self.output_path or (
+                self.repo_root / "artifacts" / "performance" / f"benchmark_{self.commit_hash}.json"
+            )
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._output_path_resolved = path
+        return self._output_path_resolved
+        
+    def _compile_or_cache(self, ls_source: str, force: bool = False) -> Tuple[bytes, float]:
+        """Compile LUASCRIPT source, reusing the .lua artifact cached for this compiler build.
+
+        Returns the compiled Lua (UTF-8 bytes) and the compile time in ms (0.0
+        on a cache hit). ``force`` always recompiles and refreshes the cache
+        entry. A fresh compile hands back the compiler's output directly rather
+        than reading the artifact it just wrote.
+        """
+        key = f"{self.commit_hash}\0{_compiler_fingerprint(self.repo_root)}\0{ls_source}"
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        cache_path = self.cache_dir / f"{digest}.lua"
+        if not force:
+            try:
+                return cache_path.read_bytes(), 0.0
+            except FileNotFoundError:
+                pass
+
+        # The warm compiler worker is started (and its imports done) before the
+        # clock starts, so compile_time covers transpilation alone.
+        self.compiler_server.start()
+        compile_start_ns = time.perf_counter_ns()
+        lua_code = self.compiler_server.compile(ls_source)
+        compile_time = (time.perf_counter_ns() - compile_start_ns) / 1e6
+
+        # Written under a temporary name and renamed, so an interrupted write
+        # never leaves a partial entry that later runs would reuse
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(lua_code)
+        os.replace(tmp_path, cache_path)
+        return lua_code, compile_time
+
+    @staticmethod
+    def _fib_iter(n: int) -> int:
+        """Ground-truth Fibonacci value used to validate the benchmark output"""
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+        return a
+
+    def _check_result(self, test_name: str, language: str, output: str, expected: int) -> bool:
+        """Mark the logged entry invalid unless it printed ``Result: <expected>``"""
+        match = _RESULT_RE.search(output)
+        valid = match is not None and int(match.group(1)) == expected
+        self.results[test_name][language]['valid'] = valid
+        if not valid:
+            got = match.group(1) if match else "no result"
+            print(f"  ? {language} returned {got}, expected {expected}; excluded from speedups")
+        return valid
+
+    def _time_snippet(self, test_name: str, language: str, runner, code: str,
+                      expected: Optional[int] = None) -> None:
+        """Sample ``code`` on a baseline interpreter and log it as ``language``"""
+        try:
+            ok, output, samples, workload = self._sample(runner, code)
+            best = min(samples, default=0.0)
+
+            if ok:
+                self.log_result(test_name, language, best, runner.rss_mb(), samples=samples, workload=workload)
+                if expected is not None:
+                    self._check_result(test_name, language, output, expected)
+                print(f"  ? {language}: {best:.1f}ms")
+            else:
+                print(f"  ? {language} failed: {output}")
+        except Exception as e:
+            print(f"  ?? {language} benchmark failed: {e}")
+
+    def _time_luascript(self, test_name: str, ls_source: str, expected: Optional[int] = None) -> None:
+        """Compile (or reuse) ``ls_source``, sample it on the Lua worker and log it"""
+        try:
+            lua_bytes, compile_time = self._compile_or_cache(ls_source)
+            ok, output, samples, workload = self._sample(self.lua_runner, lua_bytes.decode('utf-8'))
+            best = min(samples, default=0.0)
+
+            if ok:
+                self.log_result(test_name, 'LUASCRIPT', best, self.lua_runner.rss_mb(), len(lua_bytes), compile_time, samples=samples, workload=workload)
+                if expected is not None:
+                    self._check_result(test_name, 'LUASCRIPT', output, expected)
+                print(f"  ?? LUASCRIPT: {best:.1f}ms (compile {compile_time:.1f}ms)")
             else:
-                print(f"  ? LUASCRIPT compilation failed: {compile_result.stderr}")
-                
-            os.unlink(ls_file)
+                print(f"  ? LUASCRIPT execution failed: {output}")
+        except _CompileError as e:
+            print(f"  ? LUASCRIPT compilation failed: {e}")
         except Exception as e:
-            print(f"  ⚠️ Mathematical expressions benchmark failed: {e}")
+            print(f"  ?? LUASCRIPT benchmark failed: {e}")
+
+    def run_fibonacci_benchmark(self, n: int = 35, mode: str = 'naive') -> Dict[str, float]:
+        """Benchmark Fibonacci calculation (``mode``: naive recursion, memo or iterative)"""
+        if mode not in _FIB_MODES:
+            raise ValueError(f"Unknown Fibonacci mode {mode!r}; expected one of {', '.join(_FIB_MODES)}")
+        print(f"?? Running Fibonacci({n}, {mode}) benchmark...")
+        expected = self._fib_iter(n)
+
+        self._time_snippet('fibonacci', 'JavaScript', self.node_runner,
+                           _JS_FIB_TEMPLATE.substitute(n=n, fib_body=_JS_FIB_BODIES[mode]), expected)
+        self._time_snippet('fibonacci', 'Python', self.python_runner,
+                           _PY_FIB_TEMPLATE.substitute(n=n, fib_body=_PY_FIB_BODIES[mode]), expected)
+        if self.numba_runner is not None and mode != 'memo':
+            self._time_snippet('fibonacci', 'Python+Numba', self.numba_runner,
+                               _PY_NUMBA_FIB_TEMPLATE.substitute(n=n, fib_body=_PY_FIB_BODIES[mode]), expected)
+        self._time_luascript('fibonacci', _LS_FIB_TEMPLATE.substitute(n=n, fib_body=_LS_FIB_BODIES[mode]), expected)
+
+        return self.results.get('fibonacci', {})
+
+    def run_iterative_math_benchmark(self, n: int = 1_000_000) -> Dict[str, float]:
+        """Benchmark a tight sin/cos accumulation loop (numeric throughput)"""
+        print(f"?? Running Iterative Math benchmark (n: {n})...")
+
+        self._time_snippet('iterative_math', 'JavaScript', self.node_runner, _JS_ITER_MATH_TEMPLATE.substitute(n=n))
+        self._time_snippet('iterative_math', 'Python', self.python_runner, _PY_ITER_MATH_TEMPLATE.substitute(n=n))
+        self._time_luascript('iterative_math', _LS_ITER_MATH_TEMPLATE.substitute(n=n))
+
+        return self.results.get('iterative_math', {})
+
+    def run_array_operations_benchmark(self, size: int = 10000) -> Dict[str, float]:
+        """Benchmark array map and reduce operations"""
+        size = min(size, 1000) if self.quick else size
+        print(f"?? Running Array Operations benchmark (size: {size})...")
+
+        self._time_snippet('array_ops', 'JavaScript', self.node_runner, _JS_ARRAY_OPS_TEMPLATE.substitute(size=size))
+        self._time_luascript('array_ops', _LS_ARRAY_OPS_TEMPLATE.substitute(size=size))
+
+        return self.results.get('array_ops', {})
+
+    def run_compilation_speed_benchmark(self) -> Dict[str, float]:
+        """Benchmark compilation speed"""
+        print("⚡ Running Compilation Speed benchmark...")
+        
+        # Create a moderately complex LUASCRIPT file
+        complex_code = _LS_COMPILATION_BENCHMARK
+        
+        try:
+            # Measure compilation time (always recompile: this is the path under test)
+            lua_bytes, compile_time = self._compile_or_cache(complex_code, force=True)
+            code_size = len(lua_bytes)
+
+            # Only the exit status and any error text matter here, so the
+            # program's (loop-printed) stdout is discarded rather than buffered
+            run_result = subprocess.run([self.lua_bin, '-'], input=lua_bytes, cwd=self.repo_root,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                        close_fds=False, timeout=10)
+            self.log_result('compilation', 'LUASCRIPT', compile_time, self.capture_memory_mb(), code_size, compile_time)
+            print(f"  ?? LUASCRIPT compilation: {compile_time:.1f}ms")
+
+            if run_result.returncode == 0:
+                print("  ✅ Generated code executes successfully")
+            else:
+                print(f"  ⚠️ Generated code execution warning: {run_result.stderr.decode('utf-8', errors='replace')}")
+        except _CompileError as e:
+            print(f"  ❌ LUASCRIPT compilation failed: {e}")
+        except Exception as e:
+            print(f"  ⚠️ Compilation benchmark failed: {e}")
+            
+        return self.results.get('compilation', {})
+        
+    def run_mathematical_expression_benchmark(self) -> Dict[str, float]:
+        """Benchmark mathematical expression evaluation"""
+        print("🔬 Running Mathematical Expression benchmark...")
+        
+        # LUASCRIPT version with beautiful mathematical syntax
+        self._time_luascript('math_expressions', _LS_MATH_BENCHMARK)
             
         return self.results.get('math_expressions', {})
         
+    def benchmark_phases(self) -> List[Tuple[str, tuple]]:
+        """Benchmark methods (by name) and their arguments, in report order"""
+        return [
+            ('run_fibonacci_benchmark', self._fibonacci_args()),
+            ('run_iterative_math_benchmark', (100_000 if self.quick else 1_000_000,)),
+            ('run_array_operations_benchmark', (500 if self.quick else 1000,)),
+            ('run_compilation_speed_benchmark', ()),
+            ('run_mathematical_expression_benchmark', ()),
+        ]
+
+    def _fibonacci_args(self) -> tuple:
+        # The O(n) variants can afford a much larger n than naive recursion
+        if self.fib_mode == 'naive':
+            n = 20 if self.quick else 30
+        else:
+            # LuaJIT prints numbers with %.14g: fib(67) is the last with 14 digits
+            n = 40 if self.quick else 67
+        return (n, self.fib_mode)
+
+    def run_all(self, jobs: int = 1) -> None:
+        """Run every benchmark phase, optionally spread over ``jobs`` worker processes.
+
+        Each worker builds its own LuaScriptBenchmark (and interpreter workers)
+        and hands back its ``results`` dict, which is merged here in phase order.
+        """
+        phases = self.benchmark_phases()
+        if jobs <= 1:
+            for phase, args in phases:
+                getattr(self, phase)(*args)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(phases)), initializer=_init_phase_worker) as executor:
+            futures = [
+                executor.submit(_run_phase, phase, args, self.lua_bin, self.quick, self.in_process_python)
+                for phase, args in phases
+            ]
+            for future in futures:
+                self.results.update(future.result())
+
+    @staticmethod
+    def _comparable_times(a: Dict, b: Dict) -> Tuple[float, float]:
+        """Workload times when both entries report one, else wall-clock for both"""
+        if a.get('workload_ms') is not None and b.get('workload_ms') is not None:
+            return a['workload_ms'], b['workload_ms']
+        return a['time_ms'], b['time_ms']
+
     def generate_report(self) -> str:
         """Generate comprehensive benchmark report"""
-        report = "\n" + "="*80 + "\n"
-        report += "?? LUASCRIPT PERFORMANCE BENCHMARK REPORT\n"
-        report += f"Commit: {self.commit_hash}\n"
-        report += "="*80 + "\n\n"
+        parts: List[str] = [_REPORT_HEADER.format_map({'rule': "=" * 80, 'commit': self.commit_hash})]
 
         for test_name, results in self.results.items():
-            report += f"?? {test_name.replace('_', ' ').title()}:\n"
-            report += "-" * 40 + "\n"
-
-            sorted_results = sorted(results.items(), key=lambda x: x[1].get('time_ms', 0))
-
-            for lang, data in sorted_results:
-                line = f"  {lang:12}: {data.get('time_ms', 0):8.1f}ms"
+            parts.append(f"?? {test_name.replace('_', ' ').title()}:\n")
+            parts.append("-" * 40 + "\n")
+
+            # (time, lang, data) tuples sort natively; lang is unique, so the
+            # dicts themselves are never compared
+            rows = [(data.get('time_ms', 0.0), lang, data) for lang, data in results.items()]
+            rows.sort()
+            fastest_time = rows[0][0] if rows else 0.0
+
+            for time_ms, lang, data in rows:
+                line = f"  {lang:12}: {time_ms:8.1f}ms"
+                if fastest_time and time_ms > fastest_time:
+                    line += f" [{time_ms / fastest_time:.1f}x slower]"
+                if data.get('n', 1) > 1:
+                    line += f" (± {data['time_ms_stdev']:.1f}ms, n={data['n']})"
                 if data.get('compile_time_ms') is not None:
                     line += f" (compile {data['compile_time_ms']:.1f}ms)"
                 if data.get('code_size_bytes') is not None:
                     line += f"  code {data['code_size_bytes']} bytes"
                 if data.get('memory_mb') is not None:
                     line += f"  mem {data['memory_mb']:.1f}MB"
-                report += line + "\n"
-
-            report += "\n"
+                if data.get('valid') is False:
+                    line += "  [INVALID RESULT]"
+                parts.append(line + "\n")
 
-        report += "?? PERFORMANCE SUMMARY:\n"
-        report += "-" * 40 + "\n"
+            parts.append("\n")
 
-        if 'fibonacci' in self.results and 'LUASCRIPT' in self.results['fibonacci']:
-            luascript_fib = self.results['fibonacci']['LUASCRIPT']['time_ms']
-            if 'Python' in self.results['fibonacci']:
-                python_fib = self.results['fibonacci']['Python']['time_ms']
-                speedup = python_fib / luascript_fib if luascript_fib else 0
-                report += f"  Fibonacci vs Python: {speedup:.1f}x faster ?\n"
-            if 'JavaScript' in self.results['fibonacci']:
-                js_fib = self.results['fibonacci']['JavaScript']['time_ms']
-                speedup = js_fib / luascript_fib if luascript_fib else 0
-                report += f"  Fibonacci vs JavaScript: {speedup:.1f}x faster ?\n"
+        parts.append("?? PERFORMANCE SUMMARY:\n")
+        parts.append("-" * 40 + "\n")
 
-        report += "\n?? CONCLUSION: LUASCRIPT performance tracked with per-commit metadata\n"
-        report += "   while maintaining mathematical programming elegance!\n\n"
-
-        return report
+        # Only entries that produced the correct value take part in speedups
+        fib_results = {
+            lang: data for lang, data in self.results.get('fibonacci', {}).items()
+            if data.get('valid', True)
+        }
+        math_results = self.results.get('iterative_math', {})
+        if 'LUASCRIPT' in math_results:
+            for other in ('Python', 'JavaScript'):
+                if other not in math_results:
+                    continue
+                luascript_ms, other_ms = self._comparable_times(math_results['LUASCRIPT'], math_results[other])
+                speedup = other_ms / luascript_ms if luascript_ms else 0
+                parts.append(f"  Math vs {other}: {speedup:.1f}x faster ?\n")
+        if 'LUASCRIPT' in fib_results:
+            luascript_data = fib_results['LUASCRIPT']
+            for other in ('Python', 'JavaScript'):
+                if other not in fib_results:
+                    continue
+                luascript_fib, other_fib = self._comparable_times(luascript_data, fib_results[other])
+                speedup = other_fib / luascript_fib if luascript_fib else 0
+                parts.append(f"  Call overhead (Fibonacci) vs {other}: {speedup:.1f}x faster ?\n")
+
+        parts.append(_REPORT_FOOTER)
+
+        return "".join(parts)
 
     def save_results(self, filename: Optional[str] = None):
         """Save benchmark results to JSON file"""
-        output_path = Path(filename) if filename else self.resolved_output_path()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if filename:
+            output_path = Path(filename)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            output_path = self.resolved_output_path()
         payload = {
             'commit': self.commit_hash,
             'generated_at': time.time(),
             'results': self.results
         }
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(payload, f, indent=2)
+        _write_json(output_path, payload)
         print(f"?? Results saved to {output_path}")
 
 
+if orjson is not None:
+    def _write_json(path: Path, payload) -> None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+else:
+    def _write_json(path: Path, payload) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+
+
+def _init_phase_worker() -> None:
+    # Keep concurrently running phases from oversubscribing the cores.
+    os.environ['OMP_NUM_THREADS'] = '1'
+
+
+def _run_phase(phase: str, args: tuple, lua_bin: str, quick: bool, in_process_python: bool = False) -> Dict[str, Dict]:
+    """ProcessPoolExecutor entry point: run one phase in a fresh benchmark instance"""
+    with LuaScriptBenchmark(lua_bin=lua_bin, quick=quick, in_process_python=in_process_python) as benchmark:
+        getattr(benchmark, phase)(*args)
+        return benchmark.results
+
+
 def parse_args():
      parser = argparse.ArgumentParser(description='Run LUASCRIPT performance benchmarks')
      parser.add_argument('--output', help='Path to write benchmark JSON output')
      parser.add_argument('--lua-bin', default=os.environ.get('LUA_BIN', 'lua'), help='Lua interpreter to use')
      parser.add_argument('--quick', action='store_true', help='Run in quick/CI mode with reduced sizes')
      parser.add_argument('--ci', action='store_true', help='Alias for --quick with default output path')
+     parser.add_argument('--parallel', nargs='?', type=int, const=0, default=None, metavar='N',
+                         help='Run the benchmark phases concurrently in N worker processes '
+                              '(default: one per phase, up to the CPU count; faster, but phases share the CPU)')
+     parser.add_argument('--fib-mode', choices=_FIB_MODES, default='naive',
+                         help='Fibonacci implementation: naive recursion (call overhead), memo or iterative')
+     parser.add_argument('--in-process-python', action='store_true',
+                         help='Run the Python baselines inside the benchmark process instead of a worker interpreter')
      return parser.parse_args()
 
 
@@ -543,19 +1124,20 @@ def main():
     args = parse_args()
     quick_mode = bool(args.quick or args.ci)
 
-    benchmark = LuaScriptBenchmark(lua_bin=args.lua_bin, quick=quick_mode, output_path=args.output)
-
     # Run all benchmarks
     try:
-        benchmark.run_fibonacci_benchmark(20 if benchmark.quick else 30)
-        benchmark.run_array_operations_benchmark(500 if benchmark.quick else 1000)
-        benchmark.run_compilation_speed_benchmark()
-        benchmark.run_mathematical_expression_benchmark()
+        with LuaScriptBenchmark(lua_bin=args.lua_bin, quick=quick_mode, output_path=args.output,
+                                fib_mode=args.fib_mode, in_process_python=args.in_process_python) as benchmark:
+            if args.parallel is None:
+                jobs = 1
+            else:
+                jobs = args.parallel or min(len(benchmark.benchmark_phases()), os.cpu_count() or 1)
+            benchmark.run_all(jobs)
 
-        report = benchmark.generate_report()
-        print(report)
+            report = benchmark.generate_report()
+            print(report)
 
-        benchmark.save_results(args.output)
+            benchmark.save_results(args.output)
 
     except KeyboardInterrupt:
         print("\n?? Benchmark interrupted by user")
@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Mapping, MutableMapping, Optional
+from typing import Any, Callable, Dict, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 class ProviderRequestError(RuntimeError):
     """Represents a failure while calling the Anthropic provider."""
@@ -44,7 +46,7 @@ class AnthropicAdapter:
     model: str
     default_params: Optional[Mapping[str, Any]] = None
     response_parser: Optional[Callable[[Any], Any]] = None
-    _mutable_defaults: MutableMapping[str, Any] = field(init=False, repr=False)
+    _mutable_defaults: Dict[str, Any] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - simple data setup
         self._mutable_defaults = dict(self.default_params or {})
@@ -72,9 +74,15 @@ class AnthropicAdapter:
         propagate so the host application can handle them appropriately.
         """
 
-        payload: Dict[str, Any] = dict(self._mutable_defaults)
-        payload.update(params)
-        payload["prompt"] = prompt
+        # ``prompt`` always overrides a ``prompt`` entry in the defaults.  Calls
+        # without overrides (the common case) take a C-level dict.copy();
+        # otherwise one merged display replaces copy + update + setitem.
+        payload: Dict[str, Any]
+        if params:
+            payload = {**self._mutable_defaults, **params, "prompt": prompt}
+        else:
+            payload = self._mutable_defaults.copy()
+            payload["prompt"] = prompt
 
         try:
             response = self.client(**payload)
@@ -89,6 +97,11 @@ class AnthropicAdapter:
 def _default_response_parser(response: Any) -> Any:
     """Default logic for extracting the textual completion from a response."""
 
+    # Plain dicts (the usual client payload) take a single lookup; other
+    # Mapping wrappers keep the generic membership test.
+    if type(response) is dict:
+        completion = response.get("completion", _MISSING)
+        return response if completion is _MISSING else completion
     if isinstance(response, Mapping) and "completion" in response:
         return response["completion"]
     return response
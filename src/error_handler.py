@@ -7,13 +7,18 @@ Part of Week 2 completion - improving developer experience
 Author: Linus Torvalds (GitHub Integration Lead)
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Union
 from dataclasses import dataclass
+import re
 import traceback
 
 @dataclass
 class ErrorContext:
     """Context information for better error reporting"""
+    # Fixed slots instead of a per-instance __dict__ (fields have no defaults,
+    # so this works without dataclass(slots=True) and Python 3.10)
+    __slots__ = ("filename", "line", "column", "source_line", "error_type", "message", "suggestions")
+
     filename: str
     line: int
     column: int
@@ -40,73 +45,109 @@ class RuntimeError(LuaScriptError):
     """Runtime execution errors"""
     pass
 
+# Layout shared by every formatted error; suggestions, when present, follow it
+_FAST_TEMPLATE = (
+    "❌ {error_type} in {filename}:{line}:{column}\n\n"
+    "  {line:4d} | {source_line}\n"
+    "       | {caret}\n\n"
+    "Error: {message}"
+)
+
 def format_error(error: LuaScriptError) -> str:
     """Format error with context and suggestions"""
     if not error.context:
         return str(error)
     
     ctx = error.context
-    lines = []
-    
-    # Header
-    lines.append(f"❌ {ctx.error_type} in {ctx.filename}:{ctx.line}:{ctx.column}")
-    lines.append("")
-    
-    # Source context
-    lines.append(f"  {ctx.line:4d} | {ctx.source_line}")
-    lines.append(f"       | {' ' * ctx.column}^")
-    lines.append("")
-    
-    # Error message
-    lines.append(f"Error: {ctx.message}")
+    text = _FAST_TEMPLATE.format(
+        error_type=ctx.error_type,
+        filename=ctx.filename,
+        line=ctx.line,
+        column=ctx.column,
+        source_line=ctx.source_line,
+        caret=" " * ctx.column + "^",
+        message=ctx.message,
+    )
     
-    # Suggestions
-    if ctx.suggestions:
-        lines.append("")
-        lines.append("💡 Suggestions:")
-        for suggestion in ctx.suggestions:
-            lines.append(f"  • {suggestion}")
+    # Common case: no suggestions, a single format call
+    if not ctx.suggestions:
+        return text
     
-    return "\n".join(lines)
+    return text + "\n\n💡 Suggestions:\n" + "\n".join(
+        f"  • {suggestion}" for suggestion in ctx.suggestions)
+
+# Suggestion rules in output order. Message rules and context rules are each
+# compiled into one alternation, so every string is scanned once.
+_MESSAGE_RULES = re.compile(r"(?P<unexpected_token>Unexpected token)|(?P<undefined>(?i:undefined))")
+_CONTEXT_RULES = re.compile(r"(?P<template>template)|(?P<class_syntax>class)", re.IGNORECASE)
+
+_SUGGESTIONS = {
+    "unexpected_token": (
+        "Check for missing semicolons or brackets",
+        "Verify that all parentheses and braces are properly matched",
+        "Make sure you're using valid JavaScript-like syntax",
+    ),
+    "undefined": (
+        "Check if the variable is declared before use",
+        "Verify the variable name spelling",
+        "Make sure the variable is in scope",
+    ),
+    "template": (
+        "Use ${expression} syntax for template literals",
+        "Make sure template strings use backticks (`), not quotes",
+    ),
+    "class_syntax": (
+        "Check class method syntax: methodName() { ... }",
+        "Verify constructor syntax: constructor(params) { ... }",
+        "Make sure class methods are properly indented",
+    ),
+}
 
 def suggest_fixes(error_message: str, context: str) -> List[str]:
     """Generate helpful suggestions based on error context"""
-    suggestions = []
-    
-    if "Unexpected token" in error_message:
-        suggestions.extend([
-            "Check for missing semicolons or brackets",
-            "Verify that all parentheses and braces are properly matched",
-            "Make sure you're using valid JavaScript-like syntax"
-        ])
-    
-    if "undefined" in error_message.lower():
-        suggestions.extend([
-            "Check if the variable is declared before use",
-            "Verify the variable name spelling",
-            "Make sure the variable is in scope"
-        ])
-    
-    if "template" in context.lower():
-        suggestions.extend([
-            "Use ${expression} syntax for template literals",
-            "Make sure template strings use backticks (`), not quotes"
-        ])
+    matched = {m.lastgroup for m in _MESSAGE_RULES.finditer(error_message)}
+    matched.update(m.lastgroup for m in _CONTEXT_RULES.finditer(context))
     
-    if "class" in context.lower():
-        suggestions.extend([
-            "Check class method syntax: methodName() { ... }",
-            "Verify constructor syntax: constructor(params) { ... }",
-            "Make sure class methods are properly indented"
-        ])
+    suggestions = []
+    for rule, fixes in _SUGGESTIONS.items():
+        if rule in matched:
+            suggestions.extend(fixes)
     
     return suggestions
 
+def build_line_index(source: str) -> List[int]:
+    """Offsets at which each line of ``source`` starts; build once per compile"""
+    offsets = [0]
+    find = source.find
+    pos = find("\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = find("\n", pos + 1)
+    return offsets
+
+def source_line_at(source: str, line_index: List[int], line: int) -> str:
+    """Return 1-based ``line`` of ``source`` by slicing, without splitting the file"""
+    if line < 1 or line > len(line_index):
+        return ""
+    start = line_index[line - 1]
+    end = line_index[line] - 1 if line < len(line_index) else len(source)
+    return source[start:end].rstrip("\r")
+
 def create_error_context(filename: str, line: int, column: int, 
-                        source_lines: List[str], error_type: str, 
-                        message: str) -> ErrorContext:
-    """Create error context with suggestions"""
-    source_line = source_lines[line - 1] if line <= len(source_lines) else ""
+                        source_lines: Union[str, List[str]], error_type: str, 
+                        message: str, line_index: Optional[List[int]] = None) -> ErrorContext:
+    """Create error context with suggestions
+
+    ``source_lines`` may be the raw source text instead of a list of lines;
+    pass the ``build_line_index`` result as ``line_index`` to reuse it across
+    every error reported for that source.
+    """
+    if isinstance(source_lines, str):
+        if line_index is None:
+            line_index = build_line_index(source_lines)
+        source_line = source_line_at(source_lines, line_index, line)
+    else:
+        source_line = source_lines[line - 1] if line <= len(source_lines) else ""
     suggestions = suggest_fixes(message, source_line)
     
     return ErrorContext(
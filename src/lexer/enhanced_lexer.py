@@ -11,10 +11,13 @@ Priority: CRITICAL - Foundation for mathematical programming revolution
 """
 
 import re
+import sys
 import unicodedata
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import List, Optional, Iterator, Dict, Set
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import List, Optional, Iterator, Dict, Set, Tuple
 
 class TokenType(Enum):
     # Literals
@@ -219,7 +222,11 @@ class TokenType(Enum):
     EOF = auto()
     NEWLINE = auto()
 
-@dataclass
+# Tokens are the lexer's bulk output: slot them (no per-instance __dict__) on
+# Pythons whose dataclasses support it
+_TOKEN_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_TOKEN_SLOTS)
 class Token:
     type: TokenType
     value: str
@@ -235,6 +242,254 @@ class LexerError(Exception):
         self.context = context
         super().__init__(f"Lexer Error at line {line}, column {column}: {message}")
 
+# Mathematical Unicode mappings (module-level so hot paths skip the self. lookup)
+_MATH_CONSTANTS = {
+    'π': (TokenType.MATH_PI, 'pi'),
+    'ℯ': (TokenType.MATH_E, 'e'),
+    'φ': (TokenType.MATH_PHI, 'phi'),
+    '∞': (TokenType.MATH_INFINITY, 'infinity'),
+}
+
+_MATH_OPERATORS = {
+    '×': (TokenType.MULTIPLY_UNICODE, 'times'),
+    '÷': (TokenType.DIVIDE_UNICODE, 'divide'),
+    '−': (TokenType.MINUS_UNICODE, 'minus'),
+    '±': (TokenType.PLUS_MINUS, 'plus_minus'),
+    '√': (TokenType.SQRT, 'square_root'),
+    '→': (TokenType.ARROW_RIGHT, 'arrow_right'),
+    '←': (TokenType.ARROW_LEFT, 'arrow_left'),
+    '⇒': (TokenType.ARROW_DOUBLE, 'arrow_double'),
+    '↔': (TokenType.ARROW_LEFT_RIGHT, 'arrow_bidirectional'),
+    '≤': (TokenType.LESS_EQUAL_UNICODE, 'less_equal'),
+    '≥': (TokenType.GREATER_EQUAL_UNICODE, 'greater_equal'),
+    '≠': (TokenType.NOT_EQUAL_UNICODE, 'not_equal'),
+    '≈': (TokenType.APPROXIMATELY, 'approximately'),
+    '∝': (TokenType.PROPORTIONAL, 'proportional'),
+    '∈': (TokenType.ELEMENT_OF, 'element_of'),
+    '∉': (TokenType.NOT_ELEMENT_OF, 'not_element_of'),
+    '⊂': (TokenType.SUBSET, 'subset'),
+    '⊃': (TokenType.SUPERSET, 'superset'),
+    '∪': (TokenType.UNION, 'union'),
+    '∘': (TokenType.COMPOSITION, 'composition'),
+    '⊙': (TokenType.BINARY_COMPOSITION, 'binary_composition'),
+    'λ': (TokenType.LAMBDA, 'lambda'),
+    '∩': (TokenType.INTERSECTION, 'intersection'),
+    '∅': (TokenType.EMPTY_SET, 'empty_set'),
+    '∑': (TokenType.SUMMATION, 'summation'),
+    '∏': (TokenType.PRODUCT, 'product'),
+    '∫': (TokenType.INTEGRAL, 'integral'),
+    '∂': (TokenType.PARTIAL, 'partial'),
+    '∇': (TokenType.NABLA, 'nabla'),
+    'Δ': (TokenType.DELTA, 'delta'),
+
+    # Superscript numbers ⁰¹²³⁴⁵⁶⁷⁸⁹
+    '⁰': (TokenType.SUPERSCRIPT_NUMBER, '0'),
+    '¹': (TokenType.SUPERSCRIPT_NUMBER, '1'),
+    '²': (TokenType.SUPERSCRIPT_NUMBER, '2'),
+    '³': (TokenType.SUPERSCRIPT_NUMBER, '3'),
+    '⁴': (TokenType.SUPERSCRIPT_NUMBER, '4'),
+    '⁵': (TokenType.SUPERSCRIPT_NUMBER, '5'),
+    '⁶': (TokenType.SUPERSCRIPT_NUMBER, '6'),
+    '⁷': (TokenType.SUPERSCRIPT_NUMBER, '7'),
+    '⁸': (TokenType.SUPERSCRIPT_NUMBER, '8'),
+    '⁹': (TokenType.SUPERSCRIPT_NUMBER, '9'),
+
+    # Subscript numbers ₀₁₂₃₄₅₆₇₈₉
+    '₀': (TokenType.SUBSCRIPT_NUMBER, '0'),
+    '₁': (TokenType.SUBSCRIPT_NUMBER, '1'),
+    '₂': (TokenType.SUBSCRIPT_NUMBER, '2'),
+    '₃': (TokenType.SUBSCRIPT_NUMBER, '3'),
+    '₄': (TokenType.SUBSCRIPT_NUMBER, '4'),
+    '₅': (TokenType.SUBSCRIPT_NUMBER, '5'),
+    '₆': (TokenType.SUBSCRIPT_NUMBER, '6'),
+    '₇': (TokenType.SUBSCRIPT_NUMBER, '7'),
+    '₈': (TokenType.SUBSCRIPT_NUMBER, '8'),
+    '₉': (TokenType.SUBSCRIPT_NUMBER, '9'),
+}
+
+_KEYWORDS = {
+    # JavaScript core
+    'let': TokenType.LET,
+    'const': TokenType.CONST,
+    'var': TokenType.VAR,
+    'function': TokenType.FUNCTION,
+    'class': TokenType.CLASS,
+    'struct': TokenType.STRUCT,
+    'if': TokenType.IF,
+    'else': TokenType.ELSE,
+    'for': TokenType.FOR,
+    'while': TokenType.WHILE,
+    'do': TokenType.DO,
+    'break': TokenType.BREAK,
+    'continue': TokenType.CONTINUE,
+    'return': TokenType.RETURN,
+    'try': TokenType.TRY,
+    'catch': TokenType.CATCH,
+    'finally': TokenType.FINALLY,
+    'throw': TokenType.THROW,
+    'new': TokenType.NEW,
+    'this': TokenType.THIS,
+    'extends': TokenType.EXTENDS,
+    'static': TokenType.STATIC,
+    'true': TokenType.TRUE,
+    'false': TokenType.FALSE,
+    'null': TokenType.NULL,
+    'undefined': TokenType.UNDEFINED,
+    'of': TokenType.OF,
+    'in': TokenType.IN,
+    'instanceof': TokenType.INSTANCEOF,
+    'typeof': TokenType.TYPEOF,
+    'void': TokenType.VOID,
+    'delete': TokenType.DELETE,
+    'async': TokenType.ASYNC,
+    'await': TokenType.AWAIT,
+    'yield': TokenType.YIELD,
+    'import': TokenType.IMPORT,
+    'export': TokenType.EXPORT,
+    'from': TokenType.FROM,
+    'default': TokenType.DEFAULT,
+    'as': TokenType.AS,
+
+    # LUASCRIPT mathematical extensions
+    'neural': TokenType.NEURAL,
+    'tensor': TokenType.TENSOR,
+    'simd': TokenType.SIMD,
+    'parallel': TokenType.PARALLEL,
+    'fast': TokenType.FAST,
+    'cpu_friendly': TokenType.CPU_FRIENDLY,
+    'match': TokenType.MATCH,
+    'when': TokenType.WHEN,
+
+    # Types
+    'int8': TokenType.INT8,
+    'int16': TokenType.INT16,
+    'int32': TokenType.INT32,
+    'int64': TokenType.INT64,
+    'uint8': TokenType.UINT8,
+    'uint16': TokenType.UINT16,
+    'uint32': TokenType.UINT32,
+    'uint64': TokenType.UINT64,
+    'float32': TokenType.FLOAT32,
+    'float64': TokenType.FLOAT64,
+    'real': TokenType.REAL,
+    'complex': TokenType.COMPLEX,
+}
+
+# Every mathematical symbol -> (token type, token value, unicode_name), built
+# once so the scanner needs a single lookup. Superscript/subscript digits swap
+# value and unicode_name so the parser gets the numeric value ('2') instead of
+# the Unicode char ('²').
+_MATH_SYMBOLS = {char: (token_type, char, name) for char, (token_type, name) in _MATH_CONSTANTS.items()}
+for _char, (_token_type, _name) in _MATH_OPERATORS.items():
+    if _token_type in (TokenType.SUPERSCRIPT_NUMBER, TokenType.SUBSCRIPT_NUMBER):
+        _MATH_SYMBOLS[_char] = (_token_type, _name, _char)
+    else:
+        _MATH_SYMBOLS[_char] = (_token_type, _char, _name)
+del _char, _token_type, _name
+
+# Operator and punctuation lexemes; the master regex tries longer ones first
+_OPERATORS = {
+    '===': TokenType.STRICT_EQUAL,
+    '!==': TokenType.STRICT_NOT_EQUAL,
+    '...': TokenType.DOT_DOT_DOT,
+    '==': TokenType.EQUAL,
+    '!=': TokenType.NOT_EQUAL,
+    '=>': TokenType.ARROW,
+    '<=': TokenType.LESS_EQUAL,
+    '>=': TokenType.GREATER_EQUAL,
+    '+=': TokenType.PLUS_ASSIGN,
+    '-=': TokenType.MINUS_ASSIGN,
+    '*=': TokenType.MULTIPLY_ASSIGN,
+    '/=': TokenType.DIVIDE_ASSIGN,
+    '++': TokenType.INCREMENT,
+    '--': TokenType.DECREMENT,
+    '**': TokenType.POWER,
+    '&&': TokenType.LOGICAL_AND,
+    '||': TokenType.LOGICAL_OR,
+    '|>': TokenType.PIPELINE,
+    '<|': TokenType.REVERSE_PIPELINE,
+    '..': TokenType.RANGE_INCLUSIVE,
+    '=': TokenType.ASSIGN,
+    '!': TokenType.NOT,
+    '<': TokenType.LESS,
+    '>': TokenType.GREATER,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE,
+    '%': TokenType.MODULO,
+    '^': TokenType.POWER,
+    '&': TokenType.AND,
+    '|': TokenType.OR,
+    '(': TokenType.LEFT_PAREN,
+    ')': TokenType.RIGHT_PAREN,
+    '{': TokenType.LEFT_BRACE,
+    '}': TokenType.RIGHT_BRACE,
+    '[': TokenType.LEFT_BRACKET,
+    ']': TokenType.RIGHT_BRACKET,
+    ',': TokenType.COMMA,
+    '.': TokenType.DOT,
+    ';': TokenType.SEMICOLON,
+    ':': TokenType.COLON,
+    '?': TokenType.QUESTION,
+}
+
+# One pattern for every ASCII-led lexeme, so the per-character loop runs in the
+# regex engine. Leading blanks are consumed by the same match, so whitespace
+# never costs a loop iteration of its own. Group order matters: comments before
+# '/', MATH for the mathematical Unicode symbols, OTHER (any other single
+# character) next to last, and END for trailing blanks. The pattern is built from
+# the token tables at import time and compiled by the re module into a single
+# matcher that runs in C; scanning costs are in the per-token Python work, not
+# in matching (about a sixth of tokenize() time on the sample corpus).
+_MASTER_RE = re.compile(r"""
+    [ \t\r]*
+    (?:
+    (?P<NEWLINE>\n)
+  | (?P<LINE_COMMENT>//[^\n]*)
+  | (?P<BLOCK_COMMENT>/\*)
+  | (?P<NUMBER>\d+(?:\.\d+)?(?:[eE][+-]?\d*)?)
+  | (?P<IDENTIFIER>[A-Za-z_$][\w$]*)
+  | (?P<STRING>"[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*')
+  | (?P<TEMPLATE>`)
+  | (?P<OPERATOR>%s)
+  | (?P<MATH>[%s])
+  | (?P<OTHER>.)
+  | (?P<END>\Z)
+    )
+""" % ('|'.join(re.escape(op) for op in sorted(_OPERATORS, key=len, reverse=True)),
+       ''.join(map(re.escape, _MATH_SYMBOLS))),
+    re.DOTALL | re.VERBOSE)
+_NEWLINE_GROUP = _MASTER_RE.groupindex['NEWLINE']
+_IDENTIFIER_GROUP = _MASTER_RE.groupindex['IDENTIFIER']
+_OPERATOR_GROUP = _MASTER_RE.groupindex['OPERATOR']
+
+_IDENT_TAIL_RE = re.compile(r'[\w$]*')
+_NEWLINE_RE = re.compile(r'\n')
+_TEMPLATE_TEXT_RE = re.compile(r'[^`\\$]*')
+
+# Pieces of a ${...} expression: string literals and comments are single
+# pieces, so braces inside them never affect the nesting depth
+_TEMPLATE_EXPR_RE = re.compile(r"""
+    "[^"\\]*(?:\\.[^"\\]*)*"
+  | '[^'\\]*(?:\\.[^'\\]*)*'
+  | `[^`\\]*(?:\\.[^`\\]*)*`
+  | //[^\n]*
+  | /\*.*?\*/
+  | (?P<open>\{)
+  | (?P<close>\})
+  | [^{}"'`/]+
+  | .
+""", re.DOTALL | re.VERBOSE)
+
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+_ESCAPE_MAP = {'n': '\n', 'r': '\r', 't': '\t'}
+
+def _expand_escape(m) -> str:
+    # Unknown escapes (\\, \", \q, ...) stand for the character itself
+    c = m.group(1)
+    return _ESCAPE_MAP.get(c, c)
+
 class EnhancedLexer:
     """
     LUASCRIPT Enhanced Lexer - Mathematical Unicode Support + Template String Fix
@@ -246,139 +501,10 @@ class EnhancedLexer:
     4. Performance optimization for mathematical parsing
     """
     
-    # Mathematical Unicode mappings
-    MATHEMATICAL_CONSTANTS = {
-        'π': (TokenType.MATH_PI, 'pi'),
-        'ℯ': (TokenType.MATH_E, 'e'),
-        'φ': (TokenType.MATH_PHI, 'phi'),
-        '∞': (TokenType.MATH_INFINITY, 'infinity'),
-    }
-    
-    MATHEMATICAL_OPERATORS = {
-        '×': (TokenType.MULTIPLY_UNICODE, 'times'),
-        '÷': (TokenType.DIVIDE_UNICODE, 'divide'),
-        '−': (TokenType.MINUS_UNICODE, 'minus'),
-        '±': (TokenType.PLUS_MINUS, 'plus_minus'),
-        '√': (TokenType.SQRT, 'square_root'),
-        '→': (TokenType.ARROW_RIGHT, 'arrow_right'),
-        '←': (TokenType.ARROW_LEFT, 'arrow_left'),
-        '⇒': (TokenType.ARROW_DOUBLE, 'arrow_double'),
-        '↔': (TokenType.ARROW_LEFT_RIGHT, 'arrow_bidirectional'),
-        '≤': (TokenType.LESS_EQUAL_UNICODE, 'less_equal'),
-        '≥': (TokenType.GREATER_EQUAL_UNICODE, 'greater_equal'),
-        '≠': (TokenType.NOT_EQUAL_UNICODE, 'not_equal'),
-        '≈': (TokenType.APPROXIMATELY, 'approximately'),
-        '∝': (TokenType.PROPORTIONAL, 'proportional'),
-        '∈': (TokenType.ELEMENT_OF, 'element_of'),
-        '∉': (TokenType.NOT_ELEMENT_OF, 'not_element_of'),
-        '⊂': (TokenType.SUBSET, 'subset'),
-        '⊃': (TokenType.SUPERSET, 'superset'),
-        '∪': (TokenType.UNION, 'union'),
-        '∘': (TokenType.COMPOSITION, 'composition'),
-        '⊙': (TokenType.BINARY_COMPOSITION, 'binary_composition'),
-        'λ': (TokenType.LAMBDA, 'lambda'),
-        '∩': (TokenType.INTERSECTION, 'intersection'),
-        '∅': (TokenType.EMPTY_SET, 'empty_set'),
-        '∑': (TokenType.SUMMATION, 'summation'),
-        '∏': (TokenType.PRODUCT, 'product'),
-        '∫': (TokenType.INTEGRAL, 'integral'),
-        '∂': (TokenType.PARTIAL, 'partial'),
-        '∇': (TokenType.NABLA, 'nabla'),
-        'Δ': (TokenType.DELTA, 'delta'),
-        
-        # Superscript numbers ⁰¹²³⁴⁵⁶⁷⁸⁹
-        '⁰': (TokenType.SUPERSCRIPT_NUMBER, '0'),
-        '¹': (TokenType.SUPERSCRIPT_NUMBER, '1'),
-        '²': (TokenType.SUPERSCRIPT_NUMBER, '2'),
-        '³': (TokenType.SUPERSCRIPT_NUMBER, '3'),
-        '⁴': (TokenType.SUPERSCRIPT_NUMBER, '4'),
-        '⁵': (TokenType.SUPERSCRIPT_NUMBER, '5'),
-        '⁶': (TokenType.SUPERSCRIPT_NUMBER, '6'),
-        '⁷': (TokenType.SUPERSCRIPT_NUMBER, '7'),
-        '⁸': (TokenType.SUPERSCRIPT_NUMBER, '8'),
-        '⁹': (TokenType.SUPERSCRIPT_NUMBER, '9'),
-        
-        # Subscript numbers ₀₁₂₃₄₅₆₇₈₉
-        '₀': (TokenType.SUBSCRIPT_NUMBER, '0'),
-        '₁': (TokenType.SUBSCRIPT_NUMBER, '1'),
-        '₂': (TokenType.SUBSCRIPT_NUMBER, '2'),
-        '₃': (TokenType.SUBSCRIPT_NUMBER, '3'),
-        '₄': (TokenType.SUBSCRIPT_NUMBER, '4'),
-        '₅': (TokenType.SUBSCRIPT_NUMBER, '5'),
-        '₆': (TokenType.SUBSCRIPT_NUMBER, '6'),
-        '₇': (TokenType.SUBSCRIPT_NUMBER, '7'),
-        '₈': (TokenType.SUBSCRIPT_NUMBER, '8'),
-        '₉': (TokenType.SUBSCRIPT_NUMBER, '9'),
-    }
-    
-    KEYWORDS = {
-        # JavaScript core
-        'let': TokenType.LET,
-        'const': TokenType.CONST,
-        'var': TokenType.VAR,
-        'function': TokenType.FUNCTION,
-        'fast': TokenType.FAST,
-        'class': TokenType.CLASS,
-        'struct': TokenType.STRUCT,
-        'if': TokenType.IF,
-        'else': TokenType.ELSE,
-        'for': TokenType.FOR,
-        'while': TokenType.WHILE,
-        'do': TokenType.DO,
-        'break': TokenType.BREAK,
-        'continue': TokenType.CONTINUE,
-        'return': TokenType.RETURN,
-        'try': TokenType.TRY,
-        'catch': TokenType.CATCH,
-        'finally': TokenType.FINALLY,
-        'throw': TokenType.THROW,
-        'new': TokenType.NEW,
-        'this': TokenType.THIS,
-        'extends': TokenType.EXTENDS,
-        'static': TokenType.STATIC,
-        'true': TokenType.TRUE,
-        'false': TokenType.FALSE,
-        'null': TokenType.NULL,
-        'undefined': TokenType.UNDEFINED,
-        'of': TokenType.OF,
-        'in': TokenType.IN,
-        'instanceof': TokenType.INSTANCEOF,
-        'typeof': TokenType.TYPEOF,
-        'void': TokenType.VOID,
-        'delete': TokenType.DELETE,
-        'async': TokenType.ASYNC,
-        'await': TokenType.AWAIT,
-        'yield': TokenType.YIELD,
-        'import': TokenType.IMPORT,
-        'export': TokenType.EXPORT,
-        'from': TokenType.FROM,
-        'default': TokenType.DEFAULT,
-        'as': TokenType.AS,
-        
-        # LUASCRIPT mathematical extensions
-        'neural': TokenType.NEURAL,
-        'tensor': TokenType.TENSOR,
-        'simd': TokenType.SIMD,
-        'parallel': TokenType.PARALLEL,
-        'fast': TokenType.FAST,
-        'cpu_friendly': TokenType.CPU_FRIENDLY,
-        'match': TokenType.MATCH,
-        'when': TokenType.WHEN,
-        
-        # Types
-        'int8': TokenType.INT8,
-        'int16': TokenType.INT16,
-        'int32': TokenType.INT32,
-        'int64': TokenType.INT64,
-        'uint8': TokenType.UINT8,
-        'uint16': TokenType.UINT16,
-        'uint32': TokenType.UINT32,
-        'uint64': TokenType.UINT64,
-        'float32': TokenType.FLOAT32,
-        'float64': TokenType.FLOAT64,
-        'real': TokenType.REAL,
-        'complex': TokenType.COMPLEX,
-    }
+    # Mathematical Unicode mappings and keywords (tables live at module level)
+    MATHEMATICAL_CONSTANTS = _MATH_CONSTANTS
+    MATHEMATICAL_OPERATORS = _MATH_OPERATORS
+    KEYWORDS = _KEYWORDS
     
     def __init__(self, source: str, filename: str = "<string>"):
         self.source = source
@@ -387,17 +513,73 @@ class EnhancedLexer:
         self.start = 0
         self.current = 0
         self.line = 1
-        self.column = 1
+        self._line_start = 0  # offset of the first character on self.line
+        self._line_starts: Optional[List[int]] = None  # see _pos()
         
     def tokenize(self) -> List[Token]:
         """Tokenize the entire source with enhanced error reporting"""
+        self._scan(len(self.source))
+        return self.tokens
+    
+    def iter_tokens(self, chunk_size: int = 4096) -> Iterator[Token]:
+        """Yield tokens while scanning, about chunk_size characters at a time
+
+        Only the current chunk's tokens are held, so streaming consumers keep
+        memory flat on large sources; self.tokens is drained as they go.
+        """
+        tokens = self.tokens
+        end = len(self.source)
+        while True:
+            self._scan(self.current + chunk_size)
+            yield from tokens
+            tokens.clear()
+            if self.current >= end:
+                return
+    
+    def _scan(self, stop: int):
+        """Scan lexemes starting before stop; at the end of input, add EOF"""
         try:
-            while not self.is_at_end():
-                self.start = self.current
-                self.scan_token()
+            source = self.source
+            end = len(source)
+            stop = min(stop, end)
+            match = _MASTER_RE.match
+            dispatch = self._DISPATCH
+            append = self.tokens.append
+            intern = sys.intern
+            keywords = _KEYWORDS
+            operators = _OPERATORS
+            identifier = TokenType.IDENTIFIER
+            newline = TokenType.NEWLINE
+            
+            # Scan one lexeme per master regex match and dispatch on its group.
+            # Identifiers, operators and newlines are most of all tokens, so
+            # they are emitted right here instead of through a handler and
+            # add_token()
+            while self.current < stop:
+                m = match(source, self.current)
+                group = m.lastindex
+                start = self.start = m.start(group)
+                self.current = m.end()
+                if group == _IDENTIFIER_GROUP:
+                    text = intern(m.group(group))
+                    append(Token(keywords.get(text, identifier), text,
+                                 self.line, start - self._line_start + 1))
+                elif group == _OPERATOR_GROUP:
+                    text = intern(m.group(group))
+                    append(Token(operators[text], text,
+                                 self.line, start - self._line_start + 1))
+                elif group == _NEWLINE_GROUP:
+                    append(Token(newline, '\n', self.line, start - self._line_start + 1))
+                    self.line += 1
+                    self._line_start = self.current
+                else:
+                    handler = dispatch[group]
+                    if handler is not None:
+                        handler(self, m)
                 
-            self.tokens.append(Token(TokenType.EOF, "", self.line, self.column))
-            return self.tokens
+            if self.current >= end:
+                self.start = self.current
+                self.add_token(TokenType.EOF, "")
         except Exception as e:
             context = self._get_error_context()
             if isinstance(e, LexerError):
@@ -421,108 +603,58 @@ class EnhancedLexer:
     def is_at_end(self) -> bool:
         return self.current >= len(self.source)
         
-    def scan_token(self):
-        """Enhanced token scanning with Unicode support"""
-        c = self.advance()
+    def _scan_block_comment(self, m):
+        """Skip a block comment (unterminated ones run to end of input)"""
+        # str.find runs a fast substring search; a lazy regex would test for
+        # '*/' at every character of the comment
+        close = self.source.find('*/', self.current)
+        self.current = len(self.source) if close == -1 else close + 2
+        self._track_newlines(self.start, self.current)
+    
+    # Identifier, number and operator values are interned: the same few
+    # lexemes repeat throughout a source, and later passes compare them.
+    # Token types are bound as default arguments too: TokenType.X goes through
+    # the enum metaclass's __getattr__ hook and costs ~5x a plain class attribute
+    
+    def _scan_number(self, m, _intern=sys.intern, _number=TokenType.NUMBER):
+        """Number literals with scientific notation support"""
+        text = m.group('NUMBER')
+        if text[-1] in 'eE+-':
+            raise self._error("Invalid scientific notation")
+        self.add_token(_number, _intern(text))
+    
+    def _scan_identifier(self, _keywords=_KEYWORDS, _intern=sys.intern,
+                         _identifier=TokenType.IDENTIFIER):
+        """Non-ASCII identifiers (ASCII ones are emitted inline by tokenize())"""
+        self.current = _IDENT_TAIL_RE.match(self.source, self.current).end()
+        text = _intern(self.source[self.start:self.current])
+        self.add_token(_keywords.get(text, _identifier), text)
+    
+    def _scan_string(self, m, _string=TokenType.STRING):
+        """Complete string literals; escapes are expanded in one pass"""
+        literal = m.group('STRING')
+        value = literal[1:-1]
+        if '\\' in value:
+            value = _ESCAPE_RE.sub(_expand_escape, value)
+        self.add_token(_string, value)
+        if '\n' in literal:
+            self._track_newlines(self.start, self.current)
+    
+    def _scan_math_symbol(self, m, _math_symbols=_MATH_SYMBOLS):
+        """NEW: Mathematical Unicode operators and constants"""
+        token_type, value, unicode_name = _math_symbols[m.group('MATH')]
+        self.add_token(token_type, value, unicode_name)
+    
+    def _scan_other(self, m):
+        """Everything the master regex has no dedicated group for"""
+        c = m.group('OTHER')
         
-        # Skip whitespace (except newlines)
-        if c in ' \r\t':
-            return
-            
-        # Newlines
-        if c == '\n':
-            self.add_token(TokenType.NEWLINE)
-            self.line += 1
-            self.column = 1
-            return
-            
-        # Comments
-        if c == '/':
-            if self.peek() == '/':
-                self._scan_line_comment()
-                return
-            elif self.peek() == '*':
-                self._scan_block_comment()
-                return
-            else:
-                self.add_token(TokenType.DIVIDE)
-                return
-        
-        # Template strings (FIXED: Proper ${} interpolation)
-        if c == '`':
-            self._scan_template_string()
-            return
-            
-        # Strings
         if c in '"\'':
-            self._scan_string(c)
-            return
-            
-        # Mathematical Unicode operators and constants (NEW: Unicode Support)
-        # Check BEFORE digits to handle superscript/subscript numbers properly
-        if self._is_mathematical_unicode(c):
-            self._scan_mathematical_unicode(c)
-            return
-        
-        # Numbers
-        if c.isdigit():
-            self._scan_number()
-            return
-            
-        # Pipeline and logical OR operators
-        if c == '|':
-            if self.peek() == '>':
-                self.advance()  # consume '>'
-                self.add_token(TokenType.PIPELINE)
-            elif self.peek() == '|':
-                self.advance()  # consume second '|'
-                self.add_token(TokenType.LOGICAL_OR)
-            else:
-                # Standalone | for pattern matching or bitwise OR
-                self.add_token(TokenType.OR)
-            return
-            
-        if c == '<' and self.peek() == '|':
-            self.advance()  # consume '|'
-            self.add_token(TokenType.REVERSE_PIPELINE)
-            return
-        
-        # Range operators and spread
-        if c == '.' and self.peek() == '.':
-            self.advance()  # consume second '.'
-            if self.peek() == '.':
-                self.advance()  # consume third '.'
-                self.add_token(TokenType.DOT_DOT_DOT)
-            else:
-                self.add_token(TokenType.RANGE_INCLUSIVE)
-            return
-        
-        # Standard ASCII operators
-        if self._scan_ascii_operator(c):
-            return
-            
-        # Punctuation
-        punctuation_map = {
-            '(': TokenType.LEFT_PAREN,
-            ')': TokenType.RIGHT_PAREN,
-            '{': TokenType.LEFT_BRACE,
-            '}': TokenType.RIGHT_BRACE,
-            '[': TokenType.LEFT_BRACKET,
-            ']': TokenType.RIGHT_BRACKET,
-            ',': TokenType.COMMA,
-            '.': TokenType.DOT,
-            ';': TokenType.SEMICOLON,
-            ':': TokenType.COLON,
-            '?': TokenType.QUESTION,
-            '!': TokenType.EXCLAMATION,
-        }
-        
-        if c in punctuation_map:
-            self.add_token(punctuation_map[c])
-            return
+            self.current = len(self.source)
+            raise self._error("Unterminated string literal")
             
-        # Identifiers and keywords
-        if c.isalpha() or c == '_' or c == '$':
+        # Non-ASCII identifiers (e.g. μ, σ)
+        if c.isalpha():
             self._scan_identifier()
             return
             
@@ -535,318 +667,170 @@ class EnhancedLexer:
             except ValueError:
                 char_desc = f"'{c}' (Unicode: U+{ord(c):04X})"
         
-        raise LexerError(f"Unexpected character {char_desc}", self.line, self.column)
+        raise self._error(f"Unexpected character {char_desc}")
     
-    def _scan_template_string(self):
+    def _scan_template_string(self, m=None, _text=_TEMPLATE_TEXT_RE.match,
+                              _expr_pieces=_TEMPLATE_EXPR_RE.finditer):
         """FIXED: Proper template string scanning with ${} interpolation support"""
         # Template strings can contain expressions like ${variable}
         # We need to properly tokenize these for the parser
         
-        value = ""
+        source = self.source
+        end = len(source)
+        parts = []  # literal text of the current part, joined when emitted
+        part_start = self.start
         expressions = []
         
-        while self.peek() != '`' and not self.is_at_end():
-            if self.peek() == '$' and self.peek_next() == '{':
+        while True:
+            # Plain text runs up to the next '`', '\\' or '$' in one regex step
+            chunk = _text(source, self.current)
+            parts.append(chunk.group())
+            self.current = chunk.end()
+            if self.current >= end:
+                break
+            
+            c = source[self.current]
+            if c == '`':
+                break
+                
+            if c == '\\':
+                # Handle escape sequences
+                escaped = source[self.current + 1:self.current + 2]
+                parts.append(_ESCAPE_MAP.get(escaped, escaped))
+                self.current = min(self.current + 2, end)
+                
+            elif source.startswith('${', self.current):
                 # Save the string part before the expression
+                value = ''.join(parts)
+                parts = []
                 if value:
                     if not expressions:  # First part
-                        self.add_token(TokenType.TEMPLATE_START, value)
+                        self._add_token_at(part_start, TokenType.TEMPLATE_START, value)
                     else:  # Middle part
-                        self.add_token(TokenType.TEMPLATE_MIDDLE, value)
-                    value = ""
+                        self._add_token_at(part_start, TokenType.TEMPLATE_MIDDLE, value)
                 
-                # Skip ${ 
-                self.advance()  # $
-                self.advance()  # {
-                
-                # Tokenize the expression inside ${}
-                expr_start = self.current
-                brace_count = 1
-                
-                while brace_count > 0 and not self.is_at_end():
-                    c = self.advance()
-                    if c == '{':
-                        brace_count += 1
-                    elif c == '}':
-                        brace_count -= 1
+                # Find the matching '}' (braces inside strings/comments don't count)
+                expr_start = self.current + 2  # skip ${
+                depth = 1
+                for piece in _expr_pieces(source, expr_start):
+                    kind = piece.lastgroup
+                    if kind == 'open':
+                        depth += 1
+                    elif kind == 'close':
+                        depth -= 1
+                        if depth == 0:
+                            break
+                else:
+                    # Unclosed expression: reported as an unterminated template
+                    self.current = end
+                    continue
                 
-                expr_text = self.source[expr_start:self.current-1]
-                self.add_token(TokenType.TEMPLATE_EXPRESSION, expr_text)
+                self.current = part_start = piece.end()
+                expr_text = source[expr_start:piece.start()]
+                self._add_token_at(expr_start, TokenType.TEMPLATE_EXPRESSION, expr_text)
                 expressions.append(expr_text)
                 
-            elif self.peek() == '\n':
-                value += self.advance()
-                self.line += 1
-                self.column = 1
-            elif self.peek() == '\\':
-                # Handle escape sequences
-                self.advance()  # consume backslash
-                escaped = self.advance()
-                escape_map = {
-                    'n': '\n', 'r': '\r', 't': '\t', '\\': '\\',
-                    '`': '`', '$': '$'
-                }
-                value += escape_map.get(escaped, escaped)
             else:
-                value += self.advance()
+                # A '$' that does not open an expression
+                parts.append(c)
+                self.current += 1
                 
         if self.is_at_end():
-            raise LexerError("Unterminated template string", self.line, self.column)
+            raise self._error("Unterminated template string")
             
         # Consume closing backtick
-        self.advance()
+        self.current += 1
         
         # Add final part
+        value = ''.join(parts)
         if expressions:
-            self.add_token(TokenType.TEMPLATE_END, value)
+            self._add_token_at(part_start, TokenType.TEMPLATE_END, value)
         else:
             # No expressions, just a regular template string
             self.add_token(TokenType.TEMPLATE_STRING, value)
-    
-    def _scan_string(self, quote_char: str):
-        """Scan regular string literals"""
-        value = ""
-        while self.peek() != quote_char and not self.is_at_end():
-            if self.peek() == '\n':
-                self.line += 1
-                self.column = 1
-            if self.peek() == '\\':
-                self.advance()  # consume backslash
-                escaped = self.advance()
-                escape_map = {
-                    'n': '\n', 'r': '\r', 't': '\t', '\\': '\\',
-                    '"': '"', "'": "'", '`': '`'
-                }
-                value += escape_map.get(escaped, escaped)
-            else:
-                value += self.advance()
-                
-        if self.is_at_end():
-            raise LexerError(f"Unterminated string literal", self.line, self.column)
-            
-        self.advance()  # Consume closing quote
-        self.add_token(TokenType.STRING, value)
-    
-    def _scan_number(self):
-        """Scan number literals with scientific notation support"""
-        # Integer part
-        while self.peek().isdigit():
-            self.advance()
-            
-        # Decimal part
-        if self.peek() == '.' and self.peek_next().isdigit():
-            self.advance()  # consume '.'
-            while self.peek().isdigit():
-                self.advance()
-                
-        # Scientific notation
-        if self.peek().lower() == 'e':
-            self.advance()
-            if self.peek() in '+-':
-                self.advance()
-            if not self.peek().isdigit():
-                raise LexerError("Invalid scientific notation", self.line, self.column)
-            while self.peek().isdigit():
-                self.advance()
-                
-        value = self.source[self.start:self.current]
-        self.add_token(TokenType.NUMBER, value)
-    
-    def _is_mathematical_unicode(self, char: str) -> bool:
-        """Check if character is a mathematical Unicode symbol"""
-        return (char in self.MATHEMATICAL_CONSTANTS or 
-                char in self.MATHEMATICAL_OPERATORS)
-    
-    def _scan_mathematical_unicode(self, char: str):
-        """NEW: Scan mathematical Unicode operators and constants"""
-        if char in self.MATHEMATICAL_CONSTANTS:
-            token_type, name = self.MATHEMATICAL_CONSTANTS[char]
-            self.add_token(token_type, char, unicode_name=name)
-        elif char in self.MATHEMATICAL_OPERATORS:
-            token_type, name = self.MATHEMATICAL_OPERATORS[char]
-            
-            # For superscript/subscript numbers, swap value and unicode_name
-            # so the parser gets the numeric value ('2') instead of Unicode char ('²')
-            if token_type in (TokenType.SUPERSCRIPT_NUMBER, TokenType.SUBSCRIPT_NUMBER):
-                self.add_token(token_type, name, unicode_name=char)
-            else:
-                self.add_token(token_type, char, unicode_name=name)
-    
-    def _scan_ascii_operator(self, c: str) -> bool:
-        """Scan ASCII operators with lookahead"""
-        if c == '=':
-            if self.peek() == '=':
-                self.advance()
-                if self.peek() == '=':
-                    self.advance()
-                    self.add_token(TokenType.STRICT_EQUAL)
-                else:
-                    self.add_token(TokenType.EQUAL)
-            elif self.peek() == '>':
-                self.advance()
-                self.add_token(TokenType.ARROW)
-            else:
-                self.add_token(TokenType.ASSIGN)
-            return True
-            
-        if c == '!':
-            if self.peek() == '=':
-                self.advance()
-                if self.peek() == '=':
-                    self.advance()
-                    self.add_token(TokenType.STRICT_NOT_EQUAL)
-                else:
-                    self.add_token(TokenType.NOT_EQUAL)
-            else:
-                self.add_token(TokenType.NOT)
-            return True
-            
-        if c == '<':
-            if self.peek() == '=':
-                self.advance()
-                self.add_token(TokenType.LESS_EQUAL)
-            else:
-                self.add_token(TokenType.LESS)
-            return True
-            
-        if c == '>':
-            if self.peek() == '=':
-                self.advance()
-                self.add_token(TokenType.GREATER_EQUAL)
-            else:
-                self.add_token(TokenType.GREATER)
-            return True
-        
-        if c == '+':
-            if self.peek() == '=':
-                self.advance()
-                self.add_token(TokenType.PLUS_ASSIGN)
-            elif self.peek() == '+':
-                self.advance()
-                self.add_token(TokenType.INCREMENT)
-            else:
-                self.add_token(TokenType.PLUS)
-            return True
-            
-        if c == '-':
-            if self.peek() == '=':
-                self.advance()
-                self.add_token(TokenType.MINUS_ASSIGN)
-            elif self.peek() == '-':
-                self.advance()
-                self.add_token(TokenType.DECREMENT)
-            else:
-                self.add_token(TokenType.MINUS)
-            return True
-            
-        if c == '*':
-            if self.peek() == '=':
-                self.advance()
-                self.add_token(TokenType.MULTIPLY_ASSIGN)
-            elif self.peek() == '*':
-                self.advance()
-                self.add_token(TokenType.POWER)
-            else:
-                self.add_token(TokenType.MULTIPLY)
-            return True
-            
-        if c == '&':
-            if self.peek() == '&':
-                self.advance()
-                self.add_token(TokenType.LOGICAL_AND)
-            else:
-                self.add_token(TokenType.AND)
-            return True
-            
-        if c == '|':
-            if self.peek() == '|':
-                self.advance()
-                self.add_token(TokenType.LOGICAL_OR)
-            else:
-                self.add_token(TokenType.OR)
-            return True
-        
-        single_char_ops = {
-            '/': TokenType.DIVIDE,
-            '%': TokenType.MODULO,
-            '^': TokenType.POWER,
-        }
+        self._track_newlines(self.start, self.current)
+    
+    # Master regex group -> handler (None: lexeme is skipped, or emitted
+    # inline by tokenize() for NEWLINE, IDENTIFIER and OPERATOR)
+    _HANDLERS = {
+        'NEWLINE': None,
+        'LINE_COMMENT': None,
+        'BLOCK_COMMENT': _scan_block_comment,
+        'NUMBER': _scan_number,
+        'IDENTIFIER': None,
+        'STRING': _scan_string,
+        'TEMPLATE': _scan_template_string,
+        'OPERATOR': None,
+        'MATH': _scan_math_symbol,
+        'OTHER': _scan_other,
+        'END': None,
+    }
+    # The same table as a list indexed by group number (m.lastindex), so the
+    # scan loop dispatches with a plain index instead of a name lookup
+    _DISPATCH = [None] + list(map(_HANDLERS.get, sorted(_MASTER_RE.groupindex, key=_MASTER_RE.groupindex.get)))
+    
+    def _track_newlines(self, start: int, end: int):
+        """Advance the line counter past any newlines in source[start:end]"""
+        # One reverse scan settles the common single-line case; only regions
+        # that do span lines pay for counting them
+        last = self.source.rfind('\n', start, end)
+        if last != -1:
+            self.line += self.source.count('\n', start, last + 1)
+            self._line_start = last + 1
+    
+    def _pos(self, offset: int) -> Tuple[int, int]:
+        """(line, column) of a source offset
         
-        if c in single_char_ops:
-            if c == '/' and self.peek() == '=':
-                self.advance()
-                self.add_token(TokenType.DIVIDE_ASSIGN)
-            else:
-                self.add_token(single_char_ops[c])
-            return True
-            
-        return False
-    
-    def _scan_identifier(self):
-        """Scan identifiers and keywords"""
-        while (self.peek().isalnum() or self.peek() in '_$' or 
-               self._is_valid_identifier_unicode(self.peek())):
-            self.advance()
-            
-        text = self.source[self.start:self.current]
-        token_type = self.KEYWORDS.get(text, TokenType.IDENTIFIER)
-        self.add_token(token_type, text)
-    
-    def _is_valid_identifier_unicode(self, char: str) -> bool:
-        """Check if Unicode character is valid in identifier (future extension)"""
-        # For now, stick to ASCII identifiers
-        # Future: could allow mathematical subscripts, Greek letters, etc.
-        return False
-    
-    def _scan_line_comment(self):
-        """Scan single-line comment"""
-        while self.peek() != '\n' and not self.is_at_end():
-            self.advance()
-    
-    def _scan_block_comment(self):
-        """Scan multi-line comment"""
-        self.advance()  # consume '*'
-        while not self.is_at_end():
-            if self.peek() == '*' and self.peek_next() == '/':
-                self.advance()  # consume '*'
-                self.advance()  # consume '/'
-                break
-            if self.peek() == '\n':
-                self.line += 1
-                self.column = 1
-            self.advance()
+        The scan loop keeps a running line counter for ordinary tokens; this
+        table of line-start offsets (built on first use) serves the rarer
+        positions that are not at self.start: errors and template parts.
+        """
+        if self._line_starts is None:
+            self._line_starts = [0]
+            self._line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(self.source))
+        i = bisect_right(self._line_starts, offset) - 1
+        return i + 1, offset - self._line_starts[i] + 1
+    
+    def _error(self, message: str) -> LexerError:
+        """LexerError located at the current scan position"""
+        return LexerError(message, *self._pos(self.current))
     
-    def advance(self) -> str:
-        """Consume and return current character"""
-        if self.is_at_end():
-            return '\0'
-        self.current += 1
-        self.column += 1
-        return self.source[self.current - 1]
-        
-    def peek(self) -> str:
-        """Look at current character without consuming"""
-        if self.is_at_end():
-            return '\0'
-        return self.source[self.current]
-        
-    def peek_next(self) -> str:
-        """Look at next character without consuming"""
-        if self.current + 1 >= len(self.source):
-            return '\0'
-        return self.source[self.current + 1]
-        
     def add_token(self, token_type: TokenType, value: Optional[str] = None, 
                   unicode_name: Optional[str] = None):
-        """Add token with optional Unicode name"""
+        """Add token (positioned at self.start) with optional Unicode name"""
         text = value if value is not None else self.source[self.start:self.current]
-        token = Token(token_type, text, self.line, self.column - len(text), unicode_name)
+        token = Token(token_type, text, self.line, self.start - self._line_start + 1, unicode_name)
         self.tokens.append(token)
+    
+    def _add_token_at(self, offset: int, token_type: TokenType, value: str):
+        """Add a token positioned at an arbitrary source offset"""
+        line, column = self._pos(offset)
+        self.tokens.append(Token(token_type, value, line, column))
+
+# Recently lexed sources -> their tokens, most recent last. REPLs, the IDE
+# server and test runs lex the same text again and again; keying on the text
+# itself (not just its hash) means a collision can never return wrong tokens
+_TOKEN_CACHE: "OrderedDict[Tuple[str, str], List[Token]]" = OrderedDict()
+_TOKEN_CACHE_SIZE = 32
 
 def tokenize_source(source: str, filename: str = "<string>") -> List[Token]:
-    """Enhanced tokenization with mathematical Unicode support"""
+    """Enhanced tokenization with mathematical Unicode support
+
+    Results are cached per (source, filename); each call returns a new list,
+    but the Token objects in it are shared and must not be modified.
+    """
+    key = (source, filename)
+    tokens = _TOKEN_CACHE.get(key)
+    if tokens is not None:
+        _TOKEN_CACHE.move_to_end(key)
+        return list(tokens)
+    
     lexer = EnhancedLexer(source, filename)
-    return lexer.tokenize()
+    tokens = lexer.tokenize()
+    _TOKEN_CACHE[key] = tokens
+    if len(_TOKEN_CACHE) > _TOKEN_CACHE_SIZE:
+        _TOKEN_CACHE.popitem(last=False)
+    return list(tokens)
 
 if __name__ == "__main__":
     # Test the enhanced lexer with mathematical notation
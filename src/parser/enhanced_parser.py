@@ -20,28 +20,37 @@ from dataclasses import dataclass
 import sys
 import os
 
-# Import token types from enhanced lexer
-sys.path.append(os.path.join(os.path.dirname(__file__), '../lexer'))
+# Import token types from enhanced lexer. The components are flat modules
+# found through sys.path (tests and the compiler import them that way), so
+# add the lexer directory once rather than on every import.
+_LEXER_DIR = os.path.join(os.path.dirname(__file__), '../lexer')
+if _LEXER_DIR not in sys.path:
+    sys.path.append(_LEXER_DIR)
 from enhanced_lexer import Token, TokenType, tokenize_source
 
+# AST nodes are slotted (no per-instance __dict__) on Pythons whose
+# dataclasses support it, like the lexer's Token
+_NODE_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # Enhanced AST Node definitions for full JavaScript-like syntax
 class ASTNode:
     """Base class for all AST nodes"""
-    pass
+    # Empty slots so @dataclass(slots=True) subclasses carry no __dict__
+    __slots__ = ()
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class Program(ASTNode):
     """Root program node containing all statements"""
     statements: List[ASTNode]
 
 # Variable Declarations
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class VariableDeclaration(ASTNode):
     """Variable declaration: let x = 5, const PI = 3.14"""
     kind: str  # 'let', 'const', 'var'
     declarations: List['VariableDeclarator']
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class VariableDeclarator(ASTNode):
     """Individual variable declarator within declaration"""
     id: 'Identifier'
@@ -49,7 +58,7 @@ class VariableDeclarator(ASTNode):
     type_annotation: Optional[str] = None
 
 # Function Declarations
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class FunctionDeclaration(ASTNode):
     """Function declaration: function add(a, b) { return a + b; }"""
     name: str
@@ -59,29 +68,30 @@ class FunctionDeclaration(ASTNode):
     is_mathematical: bool = False  # f(x) = expr syntax
     is_arrow: bool = False
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ArrowFunctionExpression(ASTNode):
     """Arrow function: (a, b) => a + b"""
     parameters: List['Parameter']
     body: ASTNode  # Can be expression or block
     is_async: bool = False
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class Parameter(ASTNode):
     """Function parameter"""
     name: str
     type_annotation: Optional[str] = None
     default_value: Optional[ASTNode] = None
+    is_rest: bool = False
 
 # Control Flow Statements
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class IfStatement(ASTNode):
     """If statement with optional else"""
     test: ASTNode
     consequent: ASTNode
     alternate: Optional[ASTNode] = None
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ForStatement(ASTNode):
     """Traditional for loop: for (init; test; update) body"""
     init: Optional[ASTNode]
@@ -89,128 +99,128 @@ class ForStatement(ASTNode):
     update: Optional[ASTNode]
     body: ASTNode
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ForOfStatement(ASTNode):
     """For-of loop: for (item of array) body"""
     left: ASTNode  # Variable declaration or identifier
     right: ASTNode  # Iterable expression
     body: ASTNode
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class WhileStatement(ASTNode):
     """While loop: while (condition) body"""
     test: ASTNode
     body: ASTNode
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class TryStatement(ASTNode):
     """Try-catch-finally statement"""
     block: 'BlockStatement'
     handler: Optional['CatchClause'] = None
     finalizer: Optional['BlockStatement'] = None
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class CatchClause(ASTNode):
     """Catch clause in try statement"""
-    param: Optional['Identifier']
+    param: Optional[str]  # binding name; never an expression
     body: 'BlockStatement'
 
 # Object-Oriented Programming
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ClassDeclaration(ASTNode):
     """Class declaration with optional inheritance"""
     name: str
     superclass: Optional[ASTNode]
     body: List[ASTNode]  # Method definitions
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class MethodDefinition(ASTNode):
     """Method definition within class"""
-    key: 'Identifier'
+    key: str  # method name; class methods have no computed keys
     value: FunctionDeclaration
     kind: str  # 'method', 'constructor', 'get', 'set'
     static: bool = False
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class NewExpression(ASTNode):
     """New expression: new Class(args)"""
     callee: ASTNode
     arguments: List[ASTNode]
 
 # Statements and Expressions
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class BlockStatement(ASTNode):
     """Block statement: { statements }"""
     statements: List[ASTNode]
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ExpressionStatement(ASTNode):
     """Expression used as statement"""
     expression: ASTNode
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ReturnStatement(ASTNode):
     """Return statement"""
     argument: Optional[ASTNode] = None
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class BreakStatement(ASTNode):
     """Break statement"""
     label: Optional[str] = None
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ContinueStatement(ASTNode):
     """Continue statement"""
     label: Optional[str] = None
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ThrowStatement(ASTNode):
     """Throw statement"""
     argument: ASTNode
 
 # Expressions
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class CallExpression(ASTNode):
     """Function call: func(args)"""
     callee: ASTNode
     arguments: List[ASTNode]
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class MemberExpression(ASTNode):
     """Member access: obj.prop or obj[prop]"""
     object: ASTNode
     property: ASTNode
     computed: bool = False
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class AssignmentExpression(ASTNode):
     """Assignment: x = value"""
     left: ASTNode
     operator: str  # '=', '+=', '-=', etc.
     right: ASTNode
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class BinaryExpression(ASTNode):
     """Binary operation: a + b"""
     left: ASTNode
     operator: str
     right: ASTNode
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class UnaryExpression(ASTNode):
     """Unary operation: !x, -x, ++x"""
     operator: str
     argument: ASTNode
     prefix: bool = True
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class UpdateExpression(ASTNode):
     """Update expression: x++, ++x"""
     operator: str  # '++', '--'
     argument: ASTNode
     prefix: bool = True
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ConditionalExpression(ASTNode):
     """Ternary operator: test ? consequent : alternate"""
     test: ASTNode
@@ -218,29 +228,29 @@ class ConditionalExpression(ASTNode):
     alternate: ASTNode
 
 # Literals and Identifiers
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class Identifier(ASTNode):
     """Identifier: variable name with optional subscript"""
     name: str
     subscript: Optional[str] = None  # For mathematical subscripts like x₂
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class Literal(ASTNode):
     """Literal value: number, string, boolean, null"""
     value: Union[str, int, float, bool, None]
     raw: Optional[str] = None
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ArrayExpression(ASTNode):
     """Array literal: [1, 2, 3]"""
     elements: List[Optional[ASTNode]]  # None for holes
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ObjectExpression(ASTNode):
     """Object literal: {key: value}"""
     properties: List['Property']
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class Property(ASTNode):
     """Object property"""
     key: ASTNode
@@ -251,40 +261,40 @@ class Property(ASTNode):
     computed: bool = False
 
 # Template Literals
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class TemplateLiteral(ASTNode):
     """Template literal: `Hello ${name}`"""
     quasis: List['TemplateElement']
     expressions: List[ASTNode]
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class TemplateElement(ASTNode):
     """Template literal element"""
     value: str
     tail: bool = False
 
 # Modern JavaScript Features
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class SpreadElement(ASTNode):
     """Spread element: ...array"""
     argument: ASTNode
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class RestElement(ASTNode):
     """Rest element in destructuring: ...rest"""
     argument: ASTNode
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ArrayPattern(ASTNode):
     """Array destructuring pattern: [a, b, c]"""
     elements: List[Optional[ASTNode]]
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class ObjectPattern(ASTNode):
     """Object destructuring pattern: {a, b, c}"""
     properties: List[ASTNode]
 
-@dataclass
+@dataclass(**_NODE_SLOTS)
 class AssignmentPattern(ASTNode):
     """Assignment pattern with default: a = 5"""
     left: ASTNode
@@ -298,6 +308,50 @@ class ParseError(Exception):
         self.token = token
         super().__init__(f"Parse Error: {message}")
 
+# Token type sets tested on hot paths. None contains EOF, so a membership
+# test on peek().type needs no separate is_at_end() check.
+_TYPE_TOKENS = frozenset({
+    TokenType.INT8, TokenType.INT16, TokenType.INT32, TokenType.INT64,
+    TokenType.UINT8, TokenType.UINT16, TokenType.UINT32, TokenType.UINT64,
+    TokenType.FLOAT32, TokenType.FLOAT64, TokenType.REAL, TokenType.COMPLEX,
+})
+_DECLARATION_KEYWORDS = frozenset({TokenType.LET, TokenType.CONST, TokenType.VAR})
+_STATEMENT_TERMINATORS = frozenset({TokenType.SEMICOLON, TokenType.NEWLINE})
+_ASSIGNMENT_OPERATORS = frozenset({TokenType.ASSIGN, TokenType.PLUS_ASSIGN, TokenType.MINUS_ASSIGN})
+_UNARY_OPERATORS = frozenset({
+    TokenType.NOT, TokenType.MINUS, TokenType.PLUS, TokenType.MINUS_UNICODE, TokenType.SQRT,
+})
+_UPDATE_OPERATORS = frozenset({TokenType.INCREMENT, TokenType.DECREMENT})
+_MEMBER_ACCESS = frozenset({TokenType.DOT, TokenType.LEFT_BRACKET})
+_MATH_CONSTANTS = frozenset({
+    TokenType.MATH_PI, TokenType.MATH_E, TokenType.MATH_PHI, TokenType.MATH_INFINITY,
+})
+_TEMPLATE_HEADS = frozenset({TokenType.TEMPLATE_STRING, TokenType.TEMPLATE_START})
+_TEMPLATE_TEXT = frozenset({
+    TokenType.TEMPLATE_START, TokenType.TEMPLATE_MIDDLE, TokenType.TEMPLATE_END,
+    TokenType.TEMPLATE_STRING,
+})
+_TEMPLATE_PARTS = _TEMPLATE_TEXT | {TokenType.TEMPLATE_EXPRESSION}
+
+# Binary operator precedence, loosest first
+_BINARY_PRECEDENCE = {
+    # Logical OR / AND
+    TokenType.OR: 1, TokenType.LOGICAL_OR: 1,
+    TokenType.AND: 2, TokenType.LOGICAL_AND: 2,
+    # Equality
+    TokenType.EQUAL: 3, TokenType.NOT_EQUAL: 3, TokenType.STRICT_EQUAL: 3,
+    TokenType.STRICT_NOT_EQUAL: 3, TokenType.NOT_EQUAL_UNICODE: 3,
+    # Relational
+    TokenType.LESS: 4, TokenType.GREATER: 4, TokenType.LESS_EQUAL: 4,
+    TokenType.GREATER_EQUAL: 4, TokenType.LESS_EQUAL_UNICODE: 4,
+    TokenType.GREATER_EQUAL_UNICODE: 4,
+    # Additive
+    TokenType.PLUS: 5, TokenType.MINUS: 5, TokenType.MINUS_UNICODE: 5,
+    # Multiplicative
+    TokenType.MULTIPLY: 6, TokenType.DIVIDE: 6, TokenType.MODULO: 6,
+    TokenType.MULTIPLY_UNICODE: 6, TokenType.DIVIDE_UNICODE: 6,
+}
+
 class EnhancedParser:
     """
     Enhanced LUASCRIPT Parser
@@ -320,12 +374,7 @@ class EnhancedParser:
     
     def is_type_token(self) -> bool:
         """Check if current token is a type token"""
-        type_tokens = {
-            TokenType.INT8, TokenType.INT16, TokenType.INT32, TokenType.INT64,
-            TokenType.UINT8, TokenType.UINT16, TokenType.UINT32, TokenType.UINT64,
-            TokenType.FLOAT32, TokenType.FLOAT64, TokenType.REAL, TokenType.COMPLEX
-        }
-        return self.check_any(*type_tokens)
+        return self.peek().type in _TYPE_TOKENS
         
     def parse(self, source: str, filename: str = "<string>") -> Program:
         """Main parsing entry point"""
@@ -343,12 +392,20 @@ class EnhancedParser:
     def parse_program(self) -> Program:
         """Parse complete program"""
         statements = []
+        tokens = self.tokens
+        newline, eof = TokenType.NEWLINE, TokenType.EOF
         
-        while not self.is_at_end():
+        # Newlines are skipped with local reads; self.current is re-read
+        # each pass because parse_statement() moves it
+        while True:
             # Skip newlines at top level
-            if self.match(TokenType.NEWLINE):
-                continue
-                
+            i = self.current
+            while i < len(tokens) and tokens[i].type == newline:
+                i += 1
+            self.current = i
+            if i >= len(tokens) or tokens[i].type == eof:
+                break
+            
             stmt = self.parse_statement()
             if stmt:
                 statements.append(stmt)
@@ -358,50 +415,15 @@ class EnhancedParser:
     def parse_statement(self) -> Optional[ASTNode]:
         """Parse any statement"""
         try:
-            # Variable declarations
-            if self.match(TokenType.LET):
-                return self.parse_variable_declaration('let')
-            elif self.match(TokenType.CONST):
-                return self.parse_variable_declaration('const')
-            elif self.match(TokenType.VAR):
-                return self.parse_variable_declaration('var')
-            
-            # Control flow
-            elif self.match(TokenType.IF):
-                return self.parse_if_statement()
-            elif self.match(TokenType.FOR):
-                return self.parse_for_statement()
-            elif self.match(TokenType.WHILE):
-                return self.parse_while_statement()
-            elif self.match(TokenType.TRY):
-                return self.parse_try_statement()
-            
-            # Function declarations (including fast functions)
-            elif self.match(TokenType.FAST):
-                # LUASCRIPT performance hint: fast function
-                if self.match(TokenType.FUNCTION):
-                    return self.parse_function_declaration()  # Ignore 'fast' hint for now
-                else:
-                    self.error("Expected 'function' after 'fast'")
-            elif self.match(TokenType.FUNCTION):
-                return self.parse_function_declaration()
-            
-            # Class declarations
-            elif self.match(TokenType.CLASS):
-                return self.parse_class_declaration()
-            
-            # Control statements
-            elif self.match(TokenType.RETURN):
-                return self.parse_return_statement()
-            elif self.match(TokenType.BREAK):
-                return self.parse_break_statement()
-            elif self.match(TokenType.CONTINUE):
-                return self.parse_continue_statement()
-            elif self.match(TokenType.THROW):
-                return self.parse_throw_statement()
+            # Keyword-led statements: one dict probe rather than a match()
+            # per keyword ahead of the expression statement fallback
+            handler = self._STATEMENT_HANDLERS.get(self.peek().type)
+            if handler is not None:
+                self.advance()
+                return handler(self)
             
             # Block statement
-            elif self.check(TokenType.LEFT_BRACE):
+            if self.check(TokenType.LEFT_BRACE):
                 return self.parse_block_statement()
             
             # Mathematical function: f(x) = expr
@@ -417,6 +439,13 @@ class EnhancedParser:
         except Exception as e:
             raise ParseError(f"Unexpected error parsing statement: {e}")
     
+    def parse_fast_function_declaration(self) -> FunctionDeclaration:
+        """Parse 'fast function' (LUASCRIPT performance hint)"""
+        if self.match(TokenType.FUNCTION):
+            return self.parse_function_declaration()  # Ignore 'fast' hint for now
+        else:
+            self.error("Expected 'function' after 'fast'")
+    
     def parse_variable_declaration(self, kind: str) -> VariableDeclaration:
         """Parse variable declaration: let x = 5, let [a, b] = arr, let {x, y} = obj"""
         declarations = []
@@ -483,56 +512,37 @@ class EnhancedParser:
         """
         self.consume(TokenType.LEFT_PAREN, "Expected '(' after 'for'")
         
-        # EMERGENCY FIX: Completely separate for-of and traditional parsing
-        # This eliminates the broken checkpoint mechanism
+        # Single pass: read the loop variable once, then an 'of' after it
+        # selects for-of; otherwise it becomes the traditional initializer
+        init = None
+        if self.peek().type in _DECLARATION_KEYWORDS:
+            kind = self.advance().value
+            name = self.consume(TokenType.IDENTIFIER, "Expected variable name").value
+            
+            if self.match(TokenType.OF):
+                left = VariableDeclaration(kind, [VariableDeclarator(Identifier(name))])
+                return self._parse_for_of_statement(left)
+            
+            if self.match(TokenType.ASSIGN):
+                value = self.parse_expression_with_context("variable initializer")
+                declarator = VariableDeclarator(Identifier(name), value)
+            else:
+                declarator = VariableDeclarator(Identifier(name))
+            init = VariableDeclaration(kind, [declarator])
         
-        # Strategy: Look ahead to determine for-loop type WITHOUT consuming tokens
-        is_for_of = self._is_for_of_pattern()
+        elif (self.check(TokenType.IDENTIFIER) and self.current + 1 < len(self.tokens)
+              and self.tokens[self.current + 1].type == TokenType.OF):
+            name = self.advance().value
+            self.advance()  # consume 'of'
+            return self._parse_for_of_statement(Identifier(name))
         
-        if is_for_of:
-            return self._parse_for_of_statement()
-        else:
-            return self._parse_traditional_for_statement()
-
-    def _is_for_of_pattern(self) -> bool:
-        """
-        Look ahead to detect for-of pattern without consuming tokens
-        Patterns: 'item of', 'let item of', 'const item of', 'var item of'
-        """
-        saved_position = self.current
+        elif not self.check(TokenType.SEMICOLON):
+            init = self.parse_expression_with_context("for-loop initialization")
         
-        try:
-            # Skip optional let/const/var
-            if self.check_any(TokenType.LET, TokenType.CONST, TokenType.VAR):
-                self.advance()
-            
-            # Must have identifier
-            if not self.check(TokenType.IDENTIFIER):
-                return False
-            self.advance()
-            
-            # Check for 'of' keyword
-            result = self.check(TokenType.OF)
-            return result
-            
-        except Exception:
-            return False
-        finally:
-            # GUARANTEED restoration - no matter what happens
-            self.current = saved_position
+        return self._parse_traditional_for_statement(init)
 
-    def _parse_for_of_statement(self) -> 'ForOfStatement':
-        """Parse for-of with clean, simple logic"""
-        # Parse variable or identifier
-        if self.check_any(TokenType.LET, TokenType.CONST, TokenType.VAR):
-            kind = self.advance().value
-            name = self.consume(TokenType.IDENTIFIER, "Expected identifier").value
-            left = VariableDeclaration(kind, [VariableDeclarator(Identifier(name))])
-        else:
-            name = self.consume(TokenType.IDENTIFIER, "Expected identifier").value
-            left = Identifier(name)
-        
-        self.consume(TokenType.OF, "Expected 'of' in for-of loop")
+    def _parse_for_of_statement(self, left: ASTNode) -> 'ForOfStatement':
+        """Parse the rest of a for-of loop once 'of' has been consumed"""
         right = self.parse_expression()
         self.consume(TokenType.RIGHT_PAREN, "Expected ')' after for-of")
         
@@ -544,27 +554,8 @@ class EnhancedParser:
         
         return ForOfStatement(left, right, body)
 
-    def _parse_traditional_for_statement(self) -> 'ForStatement':
-        """Parse traditional for-loop with bulletproof logic"""
-        # Parse initialization  
-        init = None
-        if not self.check(TokenType.SEMICOLON):
-            if self.check_any(TokenType.LET, TokenType.CONST, TokenType.VAR):
-                # Manual variable declaration parsing for for-loop context
-                kind_token = self.advance()  # consume let/const/var
-                name_token = self.consume(TokenType.IDENTIFIER, "Expected variable name")
-                
-                if self.check(TokenType.ASSIGN):
-                    self.advance()  # consume =
-                    value = self.parse_expression_with_context("variable initializer")
-                    declarator = VariableDeclarator(Identifier(name_token.value), value)
-                else:
-                    declarator = VariableDeclarator(Identifier(name_token.value))
-                
-                init = VariableDeclaration(kind_token.value, [declarator])
-            else:
-                init = self.parse_expression_with_context("for-loop initialization")
-        
+    def _parse_traditional_for_statement(self, init: Optional[ASTNode]) -> 'ForStatement':
+        """Parse the rest of a traditional for-loop once its initializer is read"""
         self.consume(TokenType.SEMICOLON, "Expected ';' after for-loop initializer")
         
         # Parse condition
@@ -621,7 +612,7 @@ class EnhancedParser:
             param = None
             if self.match(TokenType.LEFT_PAREN):
                 if self.check(TokenType.IDENTIFIER):
-                    param = Identifier(self.advance().value)
+                    param = self.advance().value
                 self.consume(TokenType.RIGHT_PAREN, "Expected ')' after catch parameter")
             
             body = self.parse_block_statement()
@@ -671,9 +662,16 @@ class EnhancedParser:
         old_in_class = self.in_class
         self.in_class = True
         
-        while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
-            if self.match(TokenType.NEWLINE):
-                continue
+        tokens = self.tokens
+        newline, eof, right_brace = TokenType.NEWLINE, TokenType.EOF, TokenType.RIGHT_BRACE
+        
+        while True:
+            i = self.current
+            while i < len(tokens) and tokens[i].type == newline:
+                i += 1
+            self.current = i
+            if i >= len(tokens) or tokens[i].type == right_brace or tokens[i].type == eof:
+                break
             
             method = self.parse_method_definition()
             methods.append(method)
@@ -694,7 +692,7 @@ class EnhancedParser:
         if self.check(TokenType.IDENTIFIER) and self.peek().value == 'constructor':
             kind = 'constructor'
         
-        key = Identifier(self.consume(TokenType.IDENTIFIER, "Expected method name").value)
+        key = self.consume(TokenType.IDENTIFIER, "Expected method name").value
         
         self.consume(TokenType.LEFT_PAREN, "Expected '(' after method name")
         parameters = self.parse_parameter_list()
@@ -711,7 +709,7 @@ class EnhancedParser:
         body = self.parse_block_statement()
         self.in_function = old_in_function
         
-        func = FunctionDeclaration(key.name, parameters, body, return_type)
+        func = FunctionDeclaration(key, parameters, body, return_type)
         return MethodDefinition(key, func, kind, static)
     
     def parse_mathematical_function(self) -> FunctionDeclaration:
@@ -743,9 +741,7 @@ class EnhancedParser:
             if self.match(TokenType.DOT_DOT_DOT):
                 # Rest parameter
                 name = self.consume(TokenType.IDENTIFIER, "Expected parameter name after '...'").value
-                param = Parameter(name)
-                param.is_rest = True
-                parameters.append(param)
+                parameters.append(Parameter(name, is_rest=True))
                 break
             
             name = self.consume(TokenType.IDENTIFIER, "Expected parameter name").value
@@ -773,9 +769,16 @@ class EnhancedParser:
         self.consume(TokenType.LEFT_BRACE, "Expected '{'")
         
         statements = []
-        while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
-            if self.match(TokenType.NEWLINE):
-                continue
+        tokens = self.tokens
+        newline, eof, right_brace = TokenType.NEWLINE, TokenType.EOF, TokenType.RIGHT_BRACE
+        
+        while True:
+            i = self.current
+            while i < len(tokens) and tokens[i].type == newline:
+                i += 1
+            self.current = i
+            if i >= len(tokens) or tokens[i].type == right_brace or tokens[i].type == eof:
+                break
             
             stmt = self.parse_statement()
             if stmt:
@@ -834,64 +837,57 @@ class EnhancedParser:
     
     def parse_assignment_expression(self) -> ASTNode:
         """Parse assignment expression including arrow functions"""
-        # Check for arrow functions: (x, y) => body or x => body
-        if self.check(TokenType.IDENTIFIER) or self.check(TokenType.LEFT_PAREN):
-            # Save current position to backtrack if not an arrow function
-            start_pos = self.current
-            
-            # Try to parse arrow function parameters
+        # Arrow functions: (x, y) => body or x => body. A non-consuming scan
+        # decides first, so any other expression is parsed exactly once.
+        if self._peek_is_arrow_function():
             parameters = []
             if self.match(TokenType.LEFT_PAREN):
                 # Parenthesized parameters: (x, y) => body or () => body
                 if not self.check(TokenType.RIGHT_PAREN):
-                    # Parse parameter list
                     parameters.append(Parameter(self.consume(TokenType.IDENTIFIER, "Expected parameter name").value))
                     while self.match(TokenType.COMMA):
                         parameters.append(Parameter(self.consume(TokenType.IDENTIFIER, "Expected parameter name").value))
-                
-                if not self.match(TokenType.RIGHT_PAREN):
-                    # Not valid arrow function syntax, backtrack
-                    self.current = start_pos
-                    expr = self.parse_conditional_expression()
-                else:
-                    # Check for arrow
-                    if self.match(TokenType.ARROW):
-                        # Parse arrow function body
-                        body = self.parse_assignment_expression()
-                        return ArrowFunctionExpression(parameters, body)
-                    else:
-                        # Not an arrow function, backtrack
-                        self.current = start_pos
-                        expr = self.parse_conditional_expression()
-            elif self.check(TokenType.IDENTIFIER):
-                # Single parameter without parentheses: x => body
-                next_pos = self.current + 1
-                if next_pos < len(self.tokens) and self.tokens[next_pos].type == TokenType.ARROW:
-                    # This is an arrow function
-                    param_name = self.advance().value
-                    parameters.append(Parameter(param_name))
-                    self.consume(TokenType.ARROW, "Expected '=>' in arrow function")
-                    body = self.parse_assignment_expression()
-                    return ArrowFunctionExpression(parameters, body)
-                else:
-                    # Not an arrow function
-                    expr = self.parse_conditional_expression()
+                self.consume(TokenType.RIGHT_PAREN, "Expected ')' after arrow function parameters")
             else:
-                expr = self.parse_conditional_expression()
-        else:
-            expr = self.parse_conditional_expression()
+                # Single parameter without parentheses: x => body
+                parameters.append(Parameter(self.advance().value))
+            self.consume(TokenType.ARROW, "Expected '=>' in arrow function")
+            body = self.parse_assignment_expression()
+            return ArrowFunctionExpression(parameters, body)
+        
+        expr = self.parse_conditional_expression()
         
         # Check for assignment operators
-        if self.match_any(TokenType.ASSIGN, TokenType.PLUS_ASSIGN, TokenType.MINUS_ASSIGN):
+        if self.match_in(_ASSIGNMENT_OPERATORS):
             operator = self.previous().value
             right = self.parse_assignment_expression()
             return AssignmentExpression(expr, operator, right)
         
         return expr
     
+    def _peek_is_arrow_function(self) -> bool:
+        """Check, without consuming, for 'x =>' or '(a, b) =>' at the current token"""
+        tokens = self.tokens
+        i = self.current
+        if i + 1 >= len(tokens):
+            return False
+        token_type = tokens[i].type
+        if token_type == TokenType.IDENTIFIER:
+            return tokens[i + 1].type == TokenType.ARROW
+        if token_type != TokenType.LEFT_PAREN:
+            return False
+        
+        # Only identifiers and commas can appear before the closing ')', so
+        # stop at the first other token instead of scanning to the match
+        i += 1
+        while tokens[i].type == TokenType.IDENTIFIER or tokens[i].type == TokenType.COMMA:
+            i += 1
+        return (tokens[i].type == TokenType.RIGHT_PAREN and i + 1 < len(tokens)
+                and tokens[i + 1].type == TokenType.ARROW)
+    
     def parse_conditional_expression(self) -> ASTNode:
         """Parse ternary conditional expression"""
-        expr = self.parse_logical_or_expression()
+        expr = self.parse_binary_expression(1)
         
         if self.match(TokenType.QUESTION):
             consequent = self.parse_assignment_expression()
@@ -901,86 +897,29 @@ class EnhancedParser:
         
         return expr
     
-    def parse_logical_or_expression(self) -> ASTNode:
-        """Parse logical OR expression"""
-        expr = self.parse_logical_and_expression()
-        
-        while self.match_any(TokenType.OR, TokenType.LOGICAL_OR):
-            operator = self.previous().value
-            right = self.parse_logical_and_expression()
-            expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_logical_and_expression(self) -> ASTNode:
-        """Parse logical AND expression"""
-        expr = self.parse_equality_expression()
-        
-        while self.match_any(TokenType.AND, TokenType.LOGICAL_AND):
-            operator = self.previous().value
-            right = self.parse_equality_expression()
-            expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_equality_expression(self) -> ASTNode:
-        """Parse equality expression"""
-        expr = self.parse_relational_expression()
-        
-        while self.match_any(TokenType.EQUAL, TokenType.NOT_EQUAL, 
-                            TokenType.STRICT_EQUAL, TokenType.STRICT_NOT_EQUAL,
-                            TokenType.NOT_EQUAL_UNICODE):
-            operator = self.previous().value
-            right = self.parse_relational_expression()
-            expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_relational_expression(self) -> ASTNode:
-        """Parse relational expression"""
-        expr = self.parse_additive_expression()
-        
-        while self.match_any(TokenType.LESS, TokenType.GREATER, 
-                            TokenType.LESS_EQUAL, TokenType.GREATER_EQUAL,
-                            TokenType.LESS_EQUAL_UNICODE, TokenType.GREATER_EQUAL_UNICODE):
-            operator = self.previous().value
-            right = self.parse_additive_expression()
-            expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_additive_expression(self) -> ASTNode:
-        """Parse additive expression"""
-        expr = self.parse_multiplicative_expression()
-        
-        while self.match_any(TokenType.PLUS, TokenType.MINUS, TokenType.MINUS_UNICODE):
-            operator = self.previous().value
-            right = self.parse_multiplicative_expression()
-            expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_multiplicative_expression(self) -> ASTNode:
-        """Parse multiplicative expression"""
+    def parse_binary_expression(self, min_precedence: int) -> ASTNode:
+        """Parse binary operators binding at least as tightly as min_precedence"""
+        # Precedence climbing over _BINARY_PRECEDENCE: one call per operand
+        # instead of one per precedence level. All levels are left-associative.
         expr = self.parse_unary_expression()
         
-        while self.match_any(TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO,
-                            TokenType.MULTIPLY_UNICODE, TokenType.DIVIDE_UNICODE):
-            operator = self.previous().value
-            right = self.parse_unary_expression()
+        precedence = _BINARY_PRECEDENCE.get(self.peek().type)
+        while precedence is not None and precedence >= min_precedence:
+            operator = self.advance().value
+            right = self.parse_binary_expression(precedence + 1)
             expr = BinaryExpression(expr, operator, right)
+            precedence = _BINARY_PRECEDENCE.get(self.peek().type)
         
         return expr
     
     def parse_unary_expression(self) -> ASTNode:
         """Parse unary expression"""
-        if self.match_any(TokenType.NOT, TokenType.MINUS, TokenType.PLUS, 
-                         TokenType.MINUS_UNICODE, TokenType.SQRT):
+        if self.match_in(_UNARY_OPERATORS):
             operator = self.previous().value
             expr = self.parse_unary_expression()
             return UnaryExpression(operator, expr)
         
-        if self.match_any(TokenType.INCREMENT, TokenType.DECREMENT):
+        if self.match_in(_UPDATE_OPERATORS):
             operator = self.previous().value
             expr = self.parse_postfix_expression()
             return UpdateExpression(operator, expr, prefix=True)
@@ -992,7 +931,7 @@ class EnhancedParser:
         expr = self.parse_call_expression()
         
         # Handle postfix increment/decrement
-        if self.match_any(TokenType.INCREMENT, TokenType.DECREMENT):
+        if self.match_in(_UPDATE_OPERATORS):
             operator = self.previous().value
             return UpdateExpression(operator, expr, prefix=False)
         
@@ -1021,13 +960,13 @@ class EnhancedParser:
             elif self.match(TokenType.DOT):
                 # Member access: obj.prop
                 name = self.consume(TokenType.IDENTIFIER, "Expected property name after '.'").value
-                expr = MemberExpression(expr, Identifier(name), computed=False)
+                expr = MemberExpression(expr, Identifier(name))
             
             elif self.match(TokenType.LEFT_BRACKET):
                 # Computed member access: obj[prop]
                 prop = self.parse_expression()
                 self.consume(TokenType.RIGHT_BRACKET, "Expected ']' after computed property")
-                expr = MemberExpression(expr, prop, computed=True)
+                expr = MemberExpression(expr, prop, True)  # computed
             
             else:
                 break
@@ -1076,11 +1015,11 @@ class EnhancedParser:
             return Literal(self.previous().value)
         
         # Mathematical constants
-        if self.match_any(TokenType.MATH_PI, TokenType.MATH_E, TokenType.MATH_PHI, TokenType.MATH_INFINITY):
+        if self.match_in(_MATH_CONSTANTS):
             return Identifier(self.previous().value)  # Will be handled in code generation
         
         # Template literals
-        if self.match_any(TokenType.TEMPLATE_STRING, TokenType.TEMPLATE_START):
+        if self.match_in(_TEMPLATE_HEADS):
             # Get the already consumed token
             first_token = self.previous()
             return self.parse_template_literal(first_token)
@@ -1147,9 +1086,7 @@ class EnhancedParser:
                 return TemplateLiteral(quasis, expressions)
         
         # Handle different template token types
-        while (self.check_any(TokenType.TEMPLATE_STRING, TokenType.TEMPLATE_START,
-                             TokenType.TEMPLATE_MIDDLE, TokenType.TEMPLATE_END,
-                             TokenType.TEMPLATE_EXPRESSION) and not self.is_at_end()):
+        while self.peek().type in _TEMPLATE_PARTS:
             
             if self.match(TokenType.TEMPLATE_EXPRESSION):
                 # Expression inside ${}
@@ -1162,8 +1099,7 @@ class EnhancedParser:
                     else:
                         # More complex expressions would need proper parsing
                         expressions.append(Literal(expr_text))
-            elif self.match_any(TokenType.TEMPLATE_START, TokenType.TEMPLATE_MIDDLE, 
-                               TokenType.TEMPLATE_END, TokenType.TEMPLATE_STRING):
+            elif self.match_in(_TEMPLATE_TEXT):
                 # Template text parts
                 text = self.previous().value
                 is_tail = self.previous().type == TokenType.TEMPLATE_END
@@ -1284,14 +1220,14 @@ class EnhancedParser:
         """Parse member expression for new operator"""
         expr = self.parse_primary_expression()
         
-        while self.match_any(TokenType.DOT, TokenType.LEFT_BRACKET):
+        while self.match_in(_MEMBER_ACCESS):
             if self.previous().type == TokenType.DOT:
                 name = self.consume(TokenType.IDENTIFIER, "Expected property name").value
-                expr = MemberExpression(expr, Identifier(name), computed=False)
+                expr = MemberExpression(expr, Identifier(name))
             else:
                 prop = self.parse_expression()
                 self.consume(TokenType.RIGHT_BRACKET, "Expected ']'")
-                expr = MemberExpression(expr, prop, computed=True)
+                expr = MemberExpression(expr, prop, True)  # computed
         
         return expr
     
@@ -1371,7 +1307,7 @@ class EnhancedParser:
 
     def parse_variable_declaration_or_identifier(self) -> ASTNode:
         """Parse variable declaration or identifier for for-of loops"""
-        if self.match_any(TokenType.LET, TokenType.CONST, TokenType.VAR):
+        if self.match_in(_DECLARATION_KEYWORDS):
             kind = self.previous().value
             name = self.consume(TokenType.IDENTIFIER, "Expected identifier").value
             return VariableDeclaration(kind, [VariableDeclarator(Identifier(name))])
@@ -1415,43 +1351,60 @@ class EnhancedParser:
         
         return i < len(self.tokens) and self.tokens[i].type == TokenType.ARROW
     
-    def match(self, token_type: TokenType) -> bool:
+    # Cursor primitives. These run several times per token, so each one
+    # reads self.tokens directly instead of calling is_at_end()/peek(), and
+    # binds EOF as a default argument (a TokenType.X lookup goes through
+    # EnumType.__getattr__). An EOF token never matches or advances.
+    def match(self, token_type: TokenType, _eof=TokenType.EOF) -> bool:
         """Check if current token matches type and advance if so"""
-        if self.check(token_type):
-            self.advance()
-            return True
+        current = self.current
+        if current < len(self.tokens):
+            current_type = self.tokens[current].type
+            if current_type == token_type and current_type != _eof:
+                self.current = current + 1
+                return True
         return False
     
-    def match_any(self, *token_types: TokenType) -> bool:
+    def match_any(self, *token_types: TokenType, _eof=TokenType.EOF) -> bool:
         """Check if current token matches any of the given types"""
-        for token_type in token_types:
-            if self.check(token_type):
-                self.advance()
+        current = self.current
+        if current < len(self.tokens):
+            current_type = self.tokens[current].type
+            if current_type in token_types and current_type != _eof:
+                self.current = current + 1
                 return True
         return False
     
-    def check(self, token_type: TokenType) -> bool:
+    def match_in(self, token_types: frozenset) -> bool:
+        """Advance past the current token if its type is in a module-level token set"""
+        # The sets never contain EOF, so this needs no EOF test
+        current = self.current
+        if current < len(self.tokens) and self.tokens[current].type in token_types:
+            self.current = current + 1
+            return True
+        return False
+    
+    def check(self, token_type: TokenType, _eof=TokenType.EOF) -> bool:
         """Check if current token is of given type"""
-        if self.is_at_end():
+        if self.current >= len(self.tokens):
             return False
-        return self.peek().type == token_type
+        current_type = self.tokens[self.current].type
+        return current_type == token_type and current_type != _eof
     
-    def check_any(self, *token_types: TokenType) -> bool:
+    def check_any(self, *token_types: TokenType, _eof=TokenType.EOF) -> bool:
         """Check if current token matches any of the given types"""
-        return any(self.check(token_type) for token_type in token_types)
+        if self.current >= len(self.tokens):
+            return False
+        current_type = self.tokens[self.current].type
+        return current_type in token_types and current_type != _eof
     
     def check_statement_terminator(self) -> bool:
-        """Check for statement terminator (newline, semicolon, or EOF)"""
-        return self.check_any(TokenType.NEWLINE, TokenType.SEMICOLON, TokenType.EOF)
+        """Check for statement terminator (newline or semicolon; EOF never matches)"""
+        return self.peek().type in _STATEMENT_TERMINATORS
     
     def check_type_token(self) -> bool:
         """Check if current token is a built-in type token"""
-        type_tokens = {
-            TokenType.INT8, TokenType.INT16, TokenType.INT32, TokenType.INT64,
-            TokenType.UINT8, TokenType.UINT16, TokenType.UINT32, TokenType.UINT64,
-            TokenType.FLOAT32, TokenType.FLOAT64, TokenType.REAL, TokenType.COMPLEX
-        }
-        return self.check_any(*type_tokens)
+        return self.peek().type in _TYPE_TOKENS
     
     def parse_type_annotation(self) -> str:
         """Parse type annotation including generic types like Array<int32>"""
@@ -1476,21 +1429,25 @@ class EnhancedParser:
             
             self.consume(TokenType.GREATER, "Expected '>' after generic type arguments")
             
-            # Build generic type string
+            # Build generic type string. Token values arrive interned from
+            # the lexer; intern the composed name too so repeated annotations
+            # share one string.
             args_str = ", ".join(generic_args)
-            return f"{base_type}<{args_str}>"
+            return sys.intern(f"{base_type}<{args_str}>")
         else:
             return base_type
     
-    def advance(self) -> Token:
+    def advance(self, _eof=TokenType.EOF) -> Token:
         """Consume current token and return it"""
-        if not self.is_at_end():
-            self.current += 1
-        return self.previous()
+        tokens = self.tokens
+        current = self.current
+        if current < len(tokens) and tokens[current].type != _eof:
+            self.current = current = current + 1
+        return tokens[current - 1] if current > 0 else tokens[0]
     
-    def is_at_end(self) -> bool:
+    def is_at_end(self, _eof=TokenType.EOF) -> bool:
         """Check if we're at end of tokens"""
-        return self.current >= len(self.tokens) or self.peek().type == TokenType.EOF
+        return self.current >= len(self.tokens) or self.tokens[self.current].type == _eof
     
     def peek(self) -> Token:
         """Return current token without advancing"""
@@ -1521,7 +1478,30 @@ class EnhancedParser:
     
     def consume_statement_terminator(self):
         """Consume statement terminator (optional)"""
-        self.match_any(TokenType.SEMICOLON, TokenType.NEWLINE)
+        self.match_in(_STATEMENT_TERMINATORS)
+    
+    # Statement handlers keyed by the leading keyword, which parse_statement
+    # consumes before calling handler(self)
+    _STATEMENT_HANDLERS = {
+        # Variable declarations
+        TokenType.LET: lambda self: self.parse_variable_declaration('let'),
+        TokenType.CONST: lambda self: self.parse_variable_declaration('const'),
+        TokenType.VAR: lambda self: self.parse_variable_declaration('var'),
+        # Control flow
+        TokenType.IF: parse_if_statement,
+        TokenType.FOR: parse_for_statement,
+        TokenType.WHILE: parse_while_statement,
+        TokenType.TRY: parse_try_statement,
+        # Function and class declarations
+        TokenType.FAST: parse_fast_function_declaration,
+        TokenType.FUNCTION: parse_function_declaration,
+        TokenType.CLASS: parse_class_declaration,
+        # Control statements
+        TokenType.RETURN: parse_return_statement,
+        TokenType.BREAK: parse_break_statement,
+        TokenType.CONTINUE: parse_continue_statement,
+        TokenType.THROW: parse_throw_statement,
+    }
 
 # Main parsing function
 def parse_source(source: str, filename: str = "<string>") -> Program:
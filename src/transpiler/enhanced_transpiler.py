@@ -17,8 +17,12 @@ from dataclasses import dataclass
 import sys
 import os
 
-# Import token types from enhanced lexer
-sys.path.append(os.path.join(os.path.dirname(__file__), '../lexer'))
+# Import token types from enhanced lexer; sibling directories are added to
+# sys.path once, not on every import or parse
+_LEXER_DIR = os.path.join(os.path.dirname(__file__), '../lexer')
+_PARSER_DIR = os.path.join(os.path.dirname(__file__), '../parser')
+if _LEXER_DIR not in sys.path:
+    sys.path.append(_LEXER_DIR)
 from enhanced_lexer import Token, TokenType, tokenize_source
 
 # AST Node definitions (simplified for prototype)
@@ -184,7 +188,8 @@ class EnhancedTranspiler:
     def parse_tokens(self, tokens: List[Token]) -> Program:
         """Use enhanced parser for full JavaScript-like syntax support"""
         # Import the enhanced parser and AST nodes
-        sys.path.append(os.path.join(os.path.dirname(__file__), '../parser'))
+        if _PARSER_DIR not in sys.path:
+            sys.path.append(_PARSER_DIR)
         from enhanced_parser import EnhancedParser
         from enhanced_parser import (
             Program, VariableDeclaration, VariableDeclarator, FunctionDeclaration,
@@ -773,7 +778,7 @@ class EnhancedTranspiler:
         if node.handler:
             lines.append("if not success then")
             if node.handler.param:
-                param_name = node.handler.param.name
+                param_name = node.handler.param
                 lines.append(f"  local {param_name} = error")
             
             handler_code = self.generate(node.handler.body)
@@ -821,7 +826,7 @@ class EnhancedTranspiler:
         
         # Generate methods
         for method in methods:
-            method_name = method.key.name
+            method_name = method.key
             params = [p.name for p in method.value.parameters]
             param_str = ", ".join(['self'] + params)
             
@@ -52,3 +52,47 @@ def test_keyboard_interrupt_is_not_swallowed():
 
     with pytest.raises(KeyboardInterrupt):
         adapter.invoke("Hello")
+
+
+def test_call_params_override_defaults_without_mutating_them():
+    client = DummyClient(response={"completion": "done"})
+    adapter = AnthropicAdapter(
+        client=client,
+        model="claude-3-haiku",
+        default_params={"temperature": 0.0, "max_tokens": 64},
+    )
+
+    adapter.invoke("Hello", temperature=0.7)
+    adapter.invoke("Again")
+
+    assert client.calls == [
+        {"temperature": 0.7, "max_tokens": 64, "model": "claude-3-haiku", "prompt": "Hello"},
+        {"temperature": 0.0, "max_tokens": 64, "model": "claude-3-haiku", "prompt": "Again"},
+    ]
+
+
+def test_invoke_without_params_does_not_leak_prompt_into_defaults():
+    client = DummyClient(response={"completion": "done"})
+    adapter = AnthropicAdapter(client=client, model="claude-3-haiku")
+
+    adapter.invoke("first")
+    adapter.invoke("second")
+
+    assert client.calls == [
+        {"model": "claude-3-haiku", "prompt": "first"},
+        {"model": "claude-3-haiku", "prompt": "second"},
+    ]
+
+
+def test_default_parser_handles_dicts_mappings_and_other_payloads():
+    from types import MappingProxyType
+
+    for response, expected in [
+        ({"completion": None}, None),
+        ({"id": "x"}, {"id": "x"}),
+        (MappingProxyType({"completion": "proxied"}), "proxied"),
+        ("raw text", "raw text"),
+    ]:
+        client = DummyClient(response=response)
+        adapter = AnthropicAdapter(client=client, model="claude-3-haiku")
+        assert adapter.invoke("Hello") == expected
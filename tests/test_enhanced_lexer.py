@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test Enhanced LUASCRIPT Lexer
+Token streams for operators, literals and template strings
+"""
+
+import sys
+import os
+
+# Add paths for LUASCRIPT components
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lexer'))
+
+from enhanced_lexer import tokenize_source, TokenType
+
+def kinds(source):
+    return [(t.type, t.value) for t in tokenize_source(source)][:-1]  # drop EOF
+
+def test_operators_take_longest_match():
+    """Test multi-character operators against their prefixes"""
+    assert kinds("a===b !== c /= d ... e .. f |> g") == [
+        (TokenType.IDENTIFIER, 'a'), (TokenType.STRICT_EQUAL, '==='), (TokenType.IDENTIFIER, 'b'),
+        (TokenType.STRICT_NOT_EQUAL, '!=='), (TokenType.IDENTIFIER, 'c'),
+        (TokenType.DIVIDE_ASSIGN, '/='), (TokenType.IDENTIFIER, 'd'),
+        (TokenType.DOT_DOT_DOT, '...'), (TokenType.IDENTIFIER, 'e'),
+        (TokenType.RANGE_INCLUSIVE, '..'), (TokenType.IDENTIFIER, 'f'),
+        (TokenType.PIPELINE, '|>'), (TokenType.IDENTIFIER, 'g'),
+    ]
+
+def test_template_expression_skips_braces_in_strings():
+    """Test that '}' inside a string or comment does not close ${...}"""
+    assert kinds('`a${"}"}b${ {x: 1}.x /* } */ }`') == [
+        (TokenType.TEMPLATE_START, 'a'),
+        (TokenType.TEMPLATE_EXPRESSION, '"}"'),
+        (TokenType.TEMPLATE_MIDDLE, 'b'),
+        (TokenType.TEMPLATE_EXPRESSION, ' {x: 1}.x /* } */ '),
+        (TokenType.TEMPLATE_END, ''),
+    ]
+
+def test_tokens_report_their_first_character():
+    """Test line/column of tokens after multi-line literals"""
+    tokens = tokenize_source('x = "a\nb" + `c\nd`\n  y')
+    positions = {t.value: (t.line, t.column) for t in tokens}
+    assert positions['a\nb'] == (1, 5)
+    assert positions['c\nd'] == (2, 6)
+    assert positions['y'] == (4, 3)
+
+def test_template_parts_report_their_own_position():
+    """Test line/column of each part of a multi-line template string"""
+    tokens = tokenize_source('s = `a\n  ${b} c\n${d}`')
+    assert [(t.type, t.line, t.column) for t in tokens[2:-1]] == [
+        (TokenType.TEMPLATE_START, 1, 5),
+        (TokenType.TEMPLATE_EXPRESSION, 2, 5),
+        (TokenType.TEMPLATE_MIDDLE, 2, 7),
+        (TokenType.TEMPLATE_EXPRESSION, 3, 3),
+        (TokenType.TEMPLATE_END, 3, 5),
+    ]
+
+def test_repeated_sources_reuse_cached_tokens():
+    """Test that re-lexing a source returns equal tokens in a fresh list"""
+    first = tokenize_source('let x = π × 2')
+    second = tokenize_source('let x = π × 2')
+    assert second == first and second is not first
+    assert all(a is b for a, b in zip(first, second))
+    second.pop()
+    assert len(tokenize_source('let x = π × 2')) == len(first)
+
+def test_iter_tokens_streams_the_same_tokens():
+    """Test that chunked streaming matches tokenize(), including across chunks"""
+    from enhanced_lexer import EnhancedLexer
+    source = 'let s = `a ${b + "}"} c`\n/* x\ny */ f(π × 2) // end\n' * 20
+    expected = EnhancedLexer(source).tokenize()
+    for chunk_size in (1, 7, 4096):
+        assert list(EnhancedLexer(source).iter_tokens(chunk_size)) == expected
+    assert [t.type for t in EnhancedLexer('').iter_tokens()] == [TokenType.EOF]
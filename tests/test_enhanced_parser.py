@@ -316,6 +316,27 @@ def test_comprehensive_example():
         traceback.print_exc()
     print()
 
+def test_rest_parameter_is_a_slot_field():
+    """Test that AST nodes carry no __dict__ and rest parameters are flagged"""
+    ast = parse_source("function f(a, ...rest) { return a; }", "test.ls")
+    params = ast.statements[0].parameters
+    assert [(p.name, p.is_rest) for p in params] == [('a', False), ('rest', True)]
+    assert sys.version_info < (3, 10) or not hasattr(params[0], '__dict__')
+
+def test_parenthesized_expression_is_not_an_arrow_function():
+    """Test that only '(params) =>' starts an arrow function"""
+    expr = parse_source("x = (1 + (2 * y))", "test.ls").statements[0].expression
+    assert (expr.right.operator, expr.right.right.operator) == ('+', '*')
+    arrow = parse_source("f = (a, b) => a", "test.ls").statements[0].expression.right
+    assert [p.name for p in arrow.parameters] == ['a', 'b']
+
+def test_method_keys_and_catch_params_are_plain_names():
+    """Test that names the grammar never computes are stored as strings"""
+    cls = parse_source("class A { constructor(x) { } area() { } }", "test.ls").statements[0]
+    assert [(m.key, m.kind) for m in cls.body] == [('constructor', 'constructor'), ('area', 'method')]
+    handler = parse_source("try { f() } catch (err) { g(err) }", "test.ls").statements[0].handler
+    assert handler.param == 'err'
+
 def main():
     """Run all tests"""
     print("🚀 LUASCRIPT Enhanced Parser & Transpiler Tests")
@@ -0,0 +1,83 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from error_handler import (
+    ParseError,
+    build_line_index,
+    create_error_context,
+    format_error,
+    source_line_at,
+    suggest_fixes,
+)
+
+
+def test_suggestions_follow_rule_order_without_duplicates():
+    suggestions = suggest_fixes(
+        "Unexpected token '}' after undefined name",
+        "class Foo { render() { return `${x}` } } // class template",
+    )
+
+    assert suggestions == [
+        "Check for missing semicolons or brackets",
+        "Verify that all parentheses and braces are properly matched",
+        "Make sure you're using valid JavaScript-like syntax",
+        "Check if the variable is declared before use",
+        "Verify the variable name spelling",
+        "Make sure the variable is in scope",
+        "Use ${expression} syntax for template literals",
+        "Make sure template strings use backticks (`), not quotes",
+        "Check class method syntax: methodName() { ... }",
+        "Verify constructor syntax: constructor(params) { ... }",
+        "Make sure class methods are properly indented",
+    ]
+
+
+def test_suggestion_matching_case_rules():
+    # "Unexpected token" is matched case-sensitively, the other rules are not
+    assert suggest_fixes("unexpected token", "") == []
+    assert suggest_fixes("UNDEFINED variable", "")[0] == "Check if the variable is declared before use"
+    assert suggest_fixes("", "CLASS Vector")[0] == "Check class method syntax: methodName() { ... }"
+    assert suggest_fixes("", "let x = 1;") == []
+
+
+def test_error_context_from_raw_source_matches_split_lines():
+    source = "let a = 1;\r\nclass Foo {\n\nprint(a)"
+    line_index = build_line_index(source)
+
+    for line in range(1, 5):
+        from_text = create_error_context("t.ls", line, 0, source, "ParseError", "boom", line_index)
+        from_lines = create_error_context("t.ls", line, 0, source.splitlines(), "ParseError", "boom")
+        assert from_text == from_lines
+
+    assert source_line_at(source, line_index, 5) == ""
+
+
+def test_error_context_has_no_instance_dict():
+    ctx = create_error_context("t.ls", 1, 0, ["let a = 1;"], "ParseError", "boom")
+
+    assert not hasattr(ctx, "__dict__")
+    assert ctx.source_line == "let a = 1;"
+
+
+def test_format_error_layout():
+    ctx = create_error_context("a.ls", 2, 3, ["x", "class Foo { bar"], "ParseError", "Unexpected token x")
+
+    assert format_error(ParseError("m", ctx)) == (
+        "❌ ParseError in a.ls:2:3\n"
+        "\n"
+        "     2 | class Foo { bar\n"
+        "       |    ^\n"
+        "\n"
+        "Error: Unexpected token x\n"
+        "\n"
+        "💡 Suggestions:\n"
+        + "\n".join(f"  • {s}" for s in ctx.suggestions)
+    )
+
+    ctx.suggestions = []
+    assert format_error(ParseError("m", ctx)) == (
+        "❌ ParseError in a.ls:2:3\n\n     2 | class Foo { bar\n       |    ^\n\nError: Unexpected token x"
+    )
+    assert format_error(ParseError("plain")) == "plain"